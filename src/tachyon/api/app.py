@@ -10,7 +10,9 @@ import flask
 
 from oslo_log import log
 
+from tachyon.api import cache
 from tachyon.api import errors
+from tachyon.api import json_provider
 from tachyon.api import middleware
 from tachyon.api.blueprints import aggregates
 from tachyon.api.blueprints import allocation_candidates
@@ -27,6 +29,12 @@ from tachyon.db import neo4j_api
 LOG = log.getLogger(__name__)
 
 
+class _TachyonFlask(flask.Flask):
+    """Flask application that serializes JSON with orjson."""
+
+    json_provider_class = json_provider.OrjsonProvider
+
+
 def create_app(config: dict[str, Any] | None = None) -> flask.Flask:
     """Create and configure the Flask application.
 
@@ -34,7 +42,7 @@ def create_app(config: dict[str, Any] | None = None) -> flask.Flask:
     :returns: Configured Flask application instance
     """
     LOG.debug("Creating Flask application")
-    app = flask.Flask(__name__)
+    app = _TachyonFlask(__name__)
 
     # Defaults
     app.config.setdefault("AUTH_STRATEGY", "noauth2")
@@ -42,12 +50,20 @@ def create_app(config: dict[str, Any] | None = None) -> flask.Flask:
     app.config.setdefault("NEO4J_URI", "bolt://localhost:7687")
     app.config.setdefault("NEO4J_USERNAME", "neo4j")
     app.config.setdefault("NEO4J_PASSWORD", "password")
+    app.config.setdefault("NEO4J_DATABASE", "neo4j")
+    # Connection pool settings; None keeps the driver's default
+    app.config.setdefault("NEO4J_MAX_CONNECTION_POOL_SIZE", None)
+    app.config.setdefault("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", None)
+    app.config.setdefault("NEO4J_MAX_CONNECTION_LIFETIME", None)
     app.config.setdefault("SKIP_DB_INIT", False)
+    app.config.setdefault("TRAITS_CACHE_TTL", 0)
 
     if config:
         app.config.update(config)
         LOG.debug("Applied custom configuration")
 
+    cache.init_app(app)
+
     # Register middleware and errors
     middleware.register(app)
     errors.register_handlers(app)
@@ -86,6 +102,12 @@ def _init_neo4j(app: flask.Flask) -> None:
         app.config["NEO4J_URI"],
         app.config.get("NEO4J_USERNAME"),
         app.config.get("NEO4J_PASSWORD"),
+        app.config.get("NEO4J_DATABASE"),
+        max_connection_pool_size=app.config.get("NEO4J_MAX_CONNECTION_POOL_SIZE"),
+        connection_acquisition_timeout=app.config.get(
+            "NEO4J_CONNECTION_ACQUISITION_TIMEOUT"
+        ),
+        max_connection_lifetime=app.config.get("NEO4J_MAX_CONNECTION_LIFETIME"),
     )
     app.extensions["neo4j_driver"] = driver
     LOG.info("Neo4j driver initialized")
@@ -15,6 +15,7 @@ import flask
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import aggregate as agg_policies
@@ -26,16 +27,6 @@ bp = flask.Blueprint(
 )
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -103,7 +94,7 @@ def get_aggregates(rp_uuid: str) -> tuple[flask.Response, int]:
     if not mv.is_at_least(1):
         raise errors.NotFound("The resource could not be found.")
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         provider = _check_provider_exists(session, rp_uuid)
 
         result = session.run(
@@ -191,7 +182,7 @@ def put_aggregates(rp_uuid: str) -> tuple[flask.Response, int]:
     if len(validated_aggregates) != len(set(validated_aggregates)):
         raise errors.BadRequest("Aggregates list has non-unique elements")
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         provider = _check_provider_exists(session, rp_uuid)
         current_generation = provider.get("generation", 0)
 
@@ -19,6 +19,7 @@ import os_resource_classes as orc
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import allocation_candidate as ac_policies
@@ -62,16 +63,6 @@ bp = flask.Blueprint(
 )
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -2087,7 +2078,7 @@ def list_allocation_candidates() -> tuple[flask.Response, int]:
     # The group_policy parameter without numbered groups doesn't require granular handling
     use_granular_query = has_numbered_resources
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Validate resource classes exist - use combined_resources which has all
         _validate_resource_classes(session, list(combined_resources.keys()))
 
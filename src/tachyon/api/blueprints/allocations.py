@@ -15,6 +15,7 @@ import flask
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import allocation as alloc_policies
@@ -38,16 +39,6 @@ def _mv() -> microversion.Microversion:
 bp = flask.Blueprint("allocations", __name__)
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 @bp.route("/allocations/<string:consumer_uuid>", methods=["GET"])
 def get_allocations(consumer_uuid: str) -> tuple[flask.Response, int]:
     """Get allocations for a consumer.
@@ -63,7 +54,7 @@ def get_allocations(consumer_uuid: str) -> tuple[flask.Response, int]:
     flask.g.context.can(alloc_policies.LIST)
     mv = _mv()
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         res = session.run(
             """
             MATCH (c:Consumer {uuid: $consumer_uuid})
@@ -164,7 +155,7 @@ def put_allocations(consumer_uuid: str) -> tuple[flask.Response, int]:
                 "'%s' does not match '^[A-Z0-9_]+$'" % consumer_type
             )
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         tx = session.begin_transaction()
         try:
             # Consumer generation handling depends on microversion
@@ -365,7 +356,7 @@ def delete_allocations(consumer_uuid: str) -> flask.Response:
     :returns: Response with status 204
     """
     flask.g.context.can(alloc_policies.DELETE)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Check if consumer exists
         consumer = session.run(
             "MATCH (c:Consumer {uuid: $uuid}) RETURN c",
@@ -467,7 +458,7 @@ def post_allocations() -> flask.Response:
     # Track newly created consumers so we can delete them on error
     new_consumers: list[str] = []
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         tx = session.begin_transaction()
         try:
             # Phase 1: Ensure all consumers exist and validate generations
@@ -753,7 +744,7 @@ def get_provider_allocations(rp_uuid: str) -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(alloc_policies.LIST)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Check provider exists
         provider = session.run(
             "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp",
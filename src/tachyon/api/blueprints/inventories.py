@@ -21,6 +21,7 @@ import os_resource_classes as orc
 
 from oslo_log import log
 
+from tachyon.api.db import get_driver
 from tachyon.api.errors import BadRequest
 from tachyon.api.errors import Conflict
 from tachyon.api.errors import InventoryInUse
@@ -38,13 +39,6 @@ bp = Blueprint(
 INT_MAX: int = 2_147_483_647
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app."""
-    from tachyon.api.app import get_driver
-
-    return get_driver()
-
-
 def _mv() -> Microversion:
     mv: Microversion | None = getattr(g, "microversion", None)
     if mv is None:
@@ -257,7 +251,7 @@ def list_inventories(uuid: str) -> tuple[Response, int]:
     """List all inventories for a resource provider."""
     g.context.can(inv_policies.LIST)
     mv = _mv()
-    with _driver().session() as session:
+    with get_driver().session() as session:
         res = session.run(
             """
             MATCH (rp:ResourceProvider {uuid: $uuid})
@@ -315,7 +309,7 @@ def replace_inventories(uuid: str) -> tuple[Response, int]:
         _validate_inventory(inv, rc_name, mv, action="replace", rp_uuid=uuid)
         normalized_inventories[rc_name] = _normalize_inventory(inv)
 
-    with _driver().session() as session:
+    with get_driver().session() as session:
         _check_provider_exists(session, uuid)
 
         tx = session.begin_transaction()
@@ -406,7 +400,7 @@ def get_inventory(uuid: str, rc_name: str) -> tuple[Response, int]:
     """Get a specific inventory by resource class."""
     g.context.can(inv_policies.SHOW)
     mv = _mv()
-    with _driver().session() as session:
+    with get_driver().session() as session:
         res = session.run(
             """
             MATCH (rp:ResourceProvider {uuid: $uuid})
@@ -450,7 +444,7 @@ def create_inventory(uuid: str) -> tuple[Response, int]:
     _validate_inventory(data, rc_name, mv, action="create", rp_uuid=uuid)
     norm = _normalize_inventory(data)
 
-    with _driver().session() as session:
+    with get_driver().session() as session:
         _check_provider_exists(session, uuid)
         _ensure_resource_class(session, rc_name, f"No such resource class {rc_name}")
 
@@ -555,7 +549,7 @@ def put_inventory(uuid: str, rc_name: str) -> tuple[Response, int]:
     _validate_inventory(inv, rc_name, mv, action="update", rp_uuid=uuid)
     norm = _normalize_inventory(inv)
 
-    with _driver().session() as session:
+    with get_driver().session() as session:
         tx = session.begin_transaction()
         try:
             res = tx.run(
@@ -645,7 +639,7 @@ def delete_inventory(uuid: str, rc_name: str) -> Response:
     Will fail if the inventory has active allocations.
     """
     g.context.can(inv_policies.DELETE)
-    with _driver().session() as session:
+    with get_driver().session() as session:
         # Check for allocations first
         has_allocs = session.run(
             """
@@ -702,7 +696,7 @@ def delete_all_inventories(uuid: str) -> Response:
     if mv.minor < 5:
         return Response(status=405)
 
-    with _driver().session() as session:
+    with get_driver().session() as session:
         _check_provider_exists(session, uuid)
         session.run(
             """
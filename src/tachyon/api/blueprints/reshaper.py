@@ -8,12 +8,11 @@ Available at microversion 1.30+.
 
 from __future__ import annotations
 
-from typing import Any
-
 import flask
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import allocation as alloc_policies
@@ -23,16 +22,6 @@ LOG = log.getLogger(__name__)
 bp = flask.Blueprint("reshaper", __name__, url_prefix="/reshaper")
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -110,7 +99,7 @@ def reshape() -> flask.Response:
     if not inventories_data:
         raise errors.BadRequest("'inventories' is a required field")
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         tx = session.begin_transaction()
         try:
             # Phase 1: Update inventories for all providers
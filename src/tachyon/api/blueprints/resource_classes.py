@@ -7,12 +7,11 @@ Implements Placement-compatible resource class management.
 
 from __future__ import annotations
 
-from typing import Any
-
 import flask
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.policies import resource_class as rc_policies
 
@@ -43,16 +42,6 @@ STANDARD_RESOURCE_CLASSES: frozenset[str] = frozenset(
 )
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _is_custom(name: str) -> bool:
     """Check if a resource class name is custom (user-defined).
 
@@ -69,7 +58,7 @@ def list_resource_classes() -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(rc_policies.LIST)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         rows = session.run(
             "MATCH (rc:ResourceClass) RETURN rc.name AS name ORDER BY name"
         )
@@ -101,7 +90,7 @@ def create_resource_class(name: str) -> flask.Response:
             "'name' value must start with 'CUSTOM_'."
         )
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Check if resource class already exists
         exists = session.run(
             "MATCH (rc:ResourceClass {name: $name}) RETURN rc",
@@ -134,7 +123,7 @@ def get_resource_class(name: str) -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(rc_policies.SHOW)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         result = session.run(
             "MATCH (rc:ResourceClass {name: $name}) RETURN rc",
             name=name,
@@ -157,7 +146,7 @@ def delete_resource_class(name: str) -> flask.Response:
     :returns: Response with status 204
     """
     flask.g.context.can(rc_policies.DELETE)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # First check if exists (Placement API expects 404 for nonexistent)
         exists = session.run(
             "MATCH (rc:ResourceClass {name: $name}) RETURN rc",
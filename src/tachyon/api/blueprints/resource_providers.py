@@ -16,6 +16,8 @@ import flask
 
 from oslo_log import log
 
+from tachyon.api import cache as app_cache
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import resource_provider as rp_policies
@@ -25,16 +27,6 @@ LOG = log.getLogger(__name__)
 bp = flask.Blueprint("resource_providers", __name__, url_prefix="/resource_providers")
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -429,7 +421,7 @@ def list_resource_providers() -> tuple[flask.Response, int]:
     if member_of_param:
         member_of_aggregates = _parse_member_of(member_of_param)
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         if required_traits:
             missing = _missing_traits(session, required_traits)
             if missing:
@@ -549,7 +541,7 @@ def create_resource_provider() -> tuple[flask.Response, int]:
 
     status_code = 200 if mv.is_at_least(20) else 201
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Uniqueness checks
         duplicate_uuid = session.run(
             "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp", uuid=rp_uuid
@@ -633,7 +625,7 @@ def get_resource_provider(rp_uuid: str) -> tuple[flask.Response, int]:
     except errors.BadRequest:
         raise errors.NotFound("No resource provider with uuid %s found." % rp_uuid)
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         record = session.run(
             """
             MATCH (rp:ResourceProvider {uuid: $uuid})
@@ -716,7 +708,7 @@ def update_resource_provider(rp_uuid: str) -> tuple[flask.Response, int]:
     # Before microversion 1.17, generation was optional and not incremented
     require_generation = mv.is_at_least(17)
 
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         existing = session.run(
             """
             MATCH (rp:ResourceProvider {uuid: $uuid})
@@ -877,7 +869,7 @@ def delete_resource_provider(rp_uuid: str) -> flask.Response:
     :returns: Response with status 204
     """
     flask.g.context.can(rp_policies.DELETE)
-    with _driver().session() as session:
+    with db.get_driver().session() as session:
         # Check if provider exists
         exists = session.run(
             "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp",
@@ -915,6 +907,8 @@ def delete_resource_provider(rp_uuid: str) -> flask.Response:
             "MATCH (rp:ResourceProvider {uuid: $uuid}) DETACH DELETE rp",
             uuid=rp_uuid,
         )
+    # Dropping the provider's HAS_TRAIT edges changes associated listings
+    app_cache.clear_traits_cache()
 
     resp = flask.Response(status=204)
     resp.headers.pop("Content-Type", None)
@@ -11,6 +11,7 @@ import datetime
 from typing import Any
 
 import flask
+import orjson
 
 from oslo_log import log
 
@@ -42,16 +43,14 @@ def _httpdate(dt: datetime.datetime | None = None) -> str:
     return dt.strftime("%a, %d %b %Y %H:%M:%S GMT")
 
 
-@bp.route("/", methods=["GET"])
-def home() -> tuple[flask.Response, int]:
-    """Return version discovery information.
+def _versions_body() -> bytes:
+    """Encode the version discovery document.
 
-    Returns API version information following the OpenStack API guidelines
-    for version discovery.
+    The document only depends on the supported version range, so it is
+    encoded once at import. Output matches ``flask.jsonify``.
 
-    :returns: Tuple of (response, status_code)
+    :returns: JSON body bytes
     """
-    mv = _mv()
     min_version = microversion.min_version_string()
     max_version = microversion.max_version_string()
 
@@ -67,9 +66,26 @@ def home() -> tuple[flask.Response, int]:
             }
         ],
     }
+    return orjson.dumps(
+        {"versions": [version_data]},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+_VERSIONS_BODY = _versions_body()
+
 
-    resp = flask.jsonify({"versions": [version_data]})
-    resp.content_type = "application/json"
+@bp.route("/", methods=["GET"])
+def home() -> tuple[flask.Response, int]:
+    """Return version discovery information.
+
+    Returns API version information following the OpenStack API guidelines
+    for version discovery.
+
+    :returns: Tuple of (response, status_code)
+    """
+    mv = _mv()
+    resp = flask.current_app.response_class(_VERSIONS_BODY, mimetype="application/json")
 
     if mv.is_at_least(15):
         resp.headers["cache-control"] = "no-cache"
@@ -12,9 +12,12 @@ import re
 from typing import Any
 
 import flask
+import orjson
 
 from oslo_log import log
 
+from tachyon.api import cache as app_cache
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import trait as trait_policies
@@ -31,16 +34,6 @@ provider_traits_bp = flask.Blueprint(
 )
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
-
-    :returns: Neo4j driver instance
-    """
-    from tachyon.api import app
-
-    return app.get_driver()
-
-
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -97,6 +90,250 @@ def _normalize_traits_qs_param(qs: str) -> dict[str, Any]:
     return filters
 
 
+def _list_traits_query(
+    associated: bool, name_in: list[str] | None, prefix: str | None
+) -> tuple[str, dict[str, Any]]:
+    """Select the Cypher template and parameters for a trait listing.
+
+    Each filter form gets its own template so the name predicate is seeked
+    through the Trait(name) index rather than filtered after a label scan.
+
+    :param associated: Only list traits associated with a provider
+    :param name_in: Trait names to match, if filtering by name
+    :param prefix: Trait name prefix, if filtering by prefix
+    :returns: Tuple of (cypher, parameters)
+    """
+    if associated:
+        if name_in:
+            return (
+                """
+                MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
+                USING INDEX t:Trait(name)
+                WHERE t.name IN $names
+                RETURN DISTINCT t.name AS name ORDER BY name
+                """,
+                {"names": name_in},
+            )
+        if prefix:
+            return (
+                """
+                MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
+                USING INDEX t:Trait(name)
+                WHERE t.name STARTS WITH $prefix
+                RETURN DISTINCT t.name AS name ORDER BY name
+                """,
+                {"prefix": prefix},
+            )
+        return (
+            """
+            MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
+            RETURN DISTINCT t.name AS name ORDER BY name
+            """,
+            {},
+        )
+    if name_in:
+        return (
+            """
+            MATCH (t:Trait)
+            USING INDEX t:Trait(name)
+            WHERE t.name IN $names
+            RETURN t.name AS name ORDER BY name
+            """,
+            {"names": name_in},
+        )
+    if prefix:
+        return (
+            """
+            MATCH (t:Trait)
+            USING INDEX t:Trait(name)
+            WHERE t.name STARTS WITH $prefix
+            RETURN t.name AS name ORDER BY name
+            """,
+            {"prefix": prefix},
+        )
+    return (
+        """
+        MATCH (t:Trait)
+        USING INDEX t:Trait(name)
+        WHERE t.name IS NOT NULL
+        RETURN t.name AS name ORDER BY name
+        """,
+        {},
+    )
+
+
+def _read_trait_names(tx: Any, cypher: str, params: dict[str, Any]) -> list[str]:
+    """Read trait names from a listing query.
+
+    :param tx: Neo4j managed transaction
+    :param cypher: Query returning one trait per row in a ``name`` column
+    :param params: Query parameters
+    :returns: List of trait names
+    """
+    return [r["name"] for r in tx.run(cypher, **params)]
+
+
+def _trait_exists(tx: Any, name: str) -> bool:
+    """Check whether a trait exists.
+
+    :param tx: Neo4j managed transaction
+    :param name: Trait name
+    :returns: True if the trait exists
+    """
+    record = tx.run("MATCH (t:Trait {name: $name}) RETURN t", name=name).single()
+    return record is not None
+
+
+def _create_trait(tx: Any, name: str) -> bool:
+    """Create a trait unless it already exists.
+
+    :param tx: Neo4j managed transaction
+    :param name: Trait name
+    :returns: True if the trait was created, False if it already existed
+    """
+    if _trait_exists(tx, name):
+        return False
+    tx.run(
+        """
+        CREATE (t:Trait {name: $name, created_at: datetime(), updated_at: datetime()})
+        """,
+        name=name,
+    )
+    return True
+
+
+def _delete_trait(tx: Any, name: str) -> Any:
+    """Delete a trait that is not associated with any provider.
+
+    Existence check, in-use check and delete run as one statement. The
+    trait is only deleted when the status is 'ok'.
+
+    :param tx: Neo4j managed transaction
+    :param name: Trait name
+    :returns: Record with ``status`` ('not_found', 'in_use' or 'ok') and
+        ``cnt``, the number of providers associated with the trait
+    """
+    return tx.run(
+        """
+        OPTIONAL MATCH (t:Trait {name: $name})
+        OPTIONAL MATCH (rp:ResourceProvider)-[:HAS_TRAIT]->(t)
+        WITH t, count(rp) AS cnt
+        WITH t, cnt, CASE
+            WHEN t IS NULL THEN 'not_found'
+            WHEN cnt > 0 THEN 'in_use'
+            ELSE 'ok'
+        END AS status
+        FOREACH (trait IN CASE WHEN status = 'ok' THEN [t] ELSE [] END |
+            DELETE trait
+        )
+        RETURN status, cnt
+        """,
+        name=name,
+    ).single()
+
+
+def _get_provider_traits(tx: Any, rp_uuid: str) -> Any:
+    """Read a provider's generation and name-ordered traits.
+
+    :param tx: Neo4j managed transaction
+    :param rp_uuid: Resource provider UUID
+    :returns: Record with ``generation`` and ``traits``, or None if the
+        provider does not exist
+    """
+    return tx.run(
+        """
+        MATCH (rp:ResourceProvider {uuid: $uuid})
+        OPTIONAL MATCH (rp)-[:HAS_TRAIT]->(t:Trait)
+        WITH rp, t ORDER BY t.name
+        RETURN rp.generation AS generation, collect(t.name) AS traits
+        """,
+        uuid=rp_uuid,
+    ).single()
+
+
+def _delete_provider_traits(tx: Any, rp_uuid: str) -> str:
+    """Remove every trait association from a provider.
+
+    Existence check and delete run as one statement.
+
+    :param tx: Neo4j managed transaction
+    :param rp_uuid: Resource provider UUID
+    :returns: 'not_found' or 'ok'
+    """
+    record = tx.run(
+        """
+        OPTIONAL MATCH (rp:ResourceProvider {uuid: $uuid})
+        OPTIONAL MATCH (rp)-[rel:HAS_TRAIT]->()
+        DELETE rel
+        RETURN CASE WHEN count(rp) = 0 THEN 'not_found' ELSE 'ok' END AS status
+        """,
+        uuid=rp_uuid,
+    ).single()
+    status: str = record["status"]
+    return status
+
+
+def _set_provider_traits(
+    tx: Any, rp_uuid: str, generation: int, traits: list[str]
+) -> Any:
+    """Replace a provider's traits and bump its generation.
+
+    Existence check, generation check, edge replacement and generation
+    increment all run as one statement. Writes only happen when the
+    status is 'ok'.
+
+    :param tx: Neo4j managed transaction
+    :param rp_uuid: Resource provider UUID
+    :param generation: Expected resource provider generation
+    :param traits: Deduplicated trait names to set
+    :returns: Record with ``status`` and the new ``generation``
+    """
+    return tx.run(
+        """
+        OPTIONAL MATCH (rp:ResourceProvider {uuid: $uuid})
+        WITH rp, CASE
+            WHEN rp IS NULL THEN 'not_found'
+            WHEN COALESCE(rp.generation, 0) <> $generation THEN 'conflict'
+            ELSE 'ok'
+        END AS status
+        OPTIONAL MATCH (rp)-[old:HAS_TRAIT]->()
+        WHERE status = 'ok'
+        WITH rp, status, collect(old) AS old_rels
+        FOREACH (rel IN old_rels | DELETE rel)
+        FOREACH (trait_name IN CASE WHEN status = 'ok' THEN $traits ELSE [] END |
+            MERGE (t:Trait {name: trait_name})
+            ON CREATE SET t.created_at = datetime()
+            MERGE (rp)-[:HAS_TRAIT]->(t)
+        )
+        FOREACH (_ IN CASE WHEN status = 'ok' THEN [1] ELSE [] END |
+            SET rp.generation = rp.generation + 1,
+                rp.updated_at = datetime()
+        )
+        RETURN status, rp.generation AS generation
+        """,
+        uuid=rp_uuid,
+        generation=generation,
+        traits=traits,
+    ).single()
+
+
+def _raise_for_provider_status(status: str, rp_uuid: str) -> None:
+    """Translate a provider check status from Cypher into an API error.
+
+    :param status: One of 'ok', 'not_found' or 'conflict'
+    :param rp_uuid: Resource provider UUID
+    :raises errors.NotFound: If the provider does not exist
+    :raises errors.ResourceProviderGenerationConflict: If the generation
+        does not match
+    """
+    if status == "not_found":
+        raise errors.NotFound("Resource provider %s not found." % rp_uuid)
+    if status == "conflict":
+        raise errors.ResourceProviderGenerationConflict(
+            "Generation mismatch for resource provider %s." % rp_uuid
+        )
+
+
 @bp.route("", methods=["GET"])
 def list_traits() -> tuple[flask.Response, int]:
     """List all traits.
@@ -134,54 +371,21 @@ def list_traits() -> tuple[flask.Response, int]:
         name_in = filters.get("name_in")
         prefix = filters.get("prefix")
 
-    # Build query based on filters
-    with _driver().session() as session:
-        if associated:
-            if name_in:
-                cypher = """
-                    MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
-                    WHERE t.name IN $names
-                    RETURN DISTINCT t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher, names=name_in)
-            elif prefix:
-                cypher = """
-                    MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
-                    WHERE t.name STARTS WITH $prefix
-                    RETURN DISTINCT t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher, prefix=prefix)
-            else:
-                cypher = """
-                    MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait)
-                    RETURN DISTINCT t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher)
+    if name_in is not None and not any(name_in):
+        # "?name=in:" cannot match any trait, skip the database round trip
+        resp = flask.jsonify({"traits": []})
+    else:
+        cypher, params = _list_traits_query(associated, name_in, prefix)
+        cache = app_cache.traits_cache()
+        cache_key = ("list", associated, name_filter)
+        body = None if cache is None else cache.get(cache_key)
+        if isinstance(body, bytes):
+            resp = flask.Response(body, mimetype="application/json")
         else:
-            if name_in:
-                cypher = """
-                    MATCH (t:Trait)
-                    WHERE t.name IN $names
-                    RETURN t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher, names=name_in)
-            elif prefix:
-                cypher = """
-                    MATCH (t:Trait)
-                    WHERE t.name STARTS WITH $prefix
-                    RETURN t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher, prefix=prefix)
-            else:
-                cypher = """
-                    MATCH (t:Trait)
-                    RETURN t.name AS name ORDER BY name
-                """
-                rows = session.run(cypher)
-
-        names = [r["name"] for r in rows]
-
-    resp = flask.jsonify({"traits": names})
+            names = db.get_driver().execute_read(_read_trait_names, cypher, params)
+            resp = flask.jsonify({"traits": names})
+            if cache is not None:
+                cache.set(cache_key, resp.get_data())
     if mv.is_at_least(15):
         resp.headers["cache-control"] = "no-cache"
         resp.headers["last-modified"] = _httpdate()
@@ -220,22 +424,12 @@ def create_trait(name: str) -> flask.Response:
             'following characters: "A"-"Z", "0"-"9" and "_"'
         )
 
-    with _driver().session() as session:
-        # Check if trait already exists
-        existing = session.run(
-            "MATCH (t:Trait {name: $name}) RETURN t", name=name
-        ).single()
-
-        if existing:
-            status = 204
-        else:
-            session.run(
-                """
-                CREATE (t:Trait {name: $name, created_at: datetime(), updated_at: datetime()})
-                """,
-                name=name,
-            )
-            status = 201
+    created = db.get_driver().execute_write(_create_trait, name)
+    if created:
+        status = 201
+        app_cache.clear_traits_cache()
+    else:
+        status = 204
 
     resp = flask.Response(status=status)
     resp.headers.pop("Content-Type", None)
@@ -259,11 +453,16 @@ def get_trait(name: str) -> flask.Response:
     flask.g.context.can(trait_policies.SHOW)
     mv = _mv()
 
-    with _driver().session() as session:
-        res = session.run("MATCH (t:Trait {name: $name}) RETURN t", name=name).single()
+    cache = app_cache.traits_cache()
+    cache_key = ("show", name)
+    exists = app_cache.MISSING if cache is None else cache.get(cache_key)
+    if exists is app_cache.MISSING:
+        exists = db.get_driver().execute_read(_trait_exists, name)
+        if cache is not None:
+            cache.set(cache_key, exists)
 
-        if not res:
-            raise errors.NotFound("No such trait(s): %s" % name)
+    if not exists:
+        raise errors.NotFound("No such trait(s): %s" % name)
 
     resp = flask.Response(status=204)
     resp.headers.pop("Content-Type", None)
@@ -283,31 +482,16 @@ def delete_trait(name: str) -> flask.Response:
     :returns: Response with status 204
     """
     flask.g.context.can(trait_policies.DELETE)
-    with _driver().session() as session:
-        # Check if trait exists
-        exists = session.run(
-            "MATCH (t:Trait {name: $name}) RETURN t", name=name
-        ).single()
-
-        if not exists:
-            raise errors.NotFound("Trait %s not found." % name)
-
-        # Check if in use
-        in_use = session.run(
-            """
-            MATCH (:ResourceProvider)-[:HAS_TRAIT]->(t:Trait {name: $name})
-            RETURN count(*) AS cnt
-            """,
-            name=name,
-        ).single()
-
-        if in_use and in_use["cnt"] > 0:
-            raise errors.Conflict(
-                "Trait %s is associated with %d "
-                "resource provider(s) and cannot be deleted." % (name, in_use["cnt"])
-            )
-
-        session.run("MATCH (t:Trait {name: $name}) DELETE t", name=name)
+    result = db.get_driver().execute_write(_delete_trait, name)
+
+    if result["status"] == "not_found":
+        raise errors.NotFound("Trait %s not found." % name)
+    if result["status"] == "in_use":
+        raise errors.Conflict(
+            "Trait %s is associated with %d "
+            "resource provider(s) and cannot be deleted." % (name, result["cnt"])
+        )
+    app_cache.clear_traits_cache()
 
     return flask.Response(status=204)
 
@@ -325,23 +509,16 @@ def get_provider_traits(rp_uuid: str) -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(trait_policies.RP_TRAIT_LIST)
-    with _driver().session() as session:
-        res = session.run(
-            """
-            MATCH (rp:ResourceProvider {uuid: $uuid})
-            OPTIONAL MATCH (rp)-[:HAS_TRAIT]->(t:Trait)
-            RETURN rp.generation AS generation, collect(t.name) AS traits
-            """,
-            uuid=rp_uuid,
-        ).single()
+    res = db.get_driver().execute_read(_get_provider_traits, rp_uuid)
 
-        if not res or res["generation"] is None:
-            raise errors.NotFound("Resource provider %s not found." % rp_uuid)
+    if not res or res["generation"] is None:
+        raise errors.NotFound("Resource provider %s not found." % rp_uuid)
 
     return flask.jsonify(
         {
             "resource_provider_generation": res["generation"],
-            "traits": sorted(res["traits"]),
+            # Already ordered by name in the query
+            "traits": res["traits"],
         }
     ), 200
 
@@ -362,73 +539,39 @@ def put_provider_traits(rp_uuid: str) -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(trait_policies.RP_TRAIT_UPDATE)
-    data = flask.request.get_json(force=True, silent=True) or {}
+    # The content-type middleware has already rejected non-JSON bodies
+    body = flask.request.get_data()
+    try:
+        data = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError as exc:
+        raise errors.BadRequest("Malformed JSON: %s" % exc)
+    if not isinstance(data, dict):
+        raise errors.BadRequest("JSON does not validate")
     generation = data.get("resource_provider_generation")
-    traits: list[str] = data.get("traits", [])
-
     if generation is None:
         raise errors.BadRequest("'resource_provider_generation' is a required field.")
-
-    with _driver().session() as session:
-        # Check provider exists and generation matches
-        provider = session.run(
-            "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp",
-            uuid=rp_uuid,
-        ).single()
-
-        if not provider:
-            raise errors.NotFound("Resource provider %s not found." % rp_uuid)
-
-        if provider["rp"].get("generation", 0) != generation:
-            raise errors.ResourceProviderGenerationConflict(
-                "Generation mismatch for resource provider %s." % rp_uuid
-            )
-
-        tx = session.begin_transaction()
-        try:
-            # Delete existing trait relationships
-            tx.run(
-                """
-                MATCH (rp:ResourceProvider {uuid: $uuid})-[rel:HAS_TRAIT]->()
-                DELETE rel
-                """,
-                uuid=rp_uuid,
-            )
-
-            # Create new trait relationships
-            if traits:
-                tx.run(
-                    """
-                    MATCH (rp:ResourceProvider {uuid: $uuid})
-                    UNWIND $traits AS trait_name
-                    MERGE (t:Trait {name: trait_name})
-                    ON CREATE SET t.created_at = datetime()
-                    CREATE (rp)-[:HAS_TRAIT]->(t)
-                    """,
-                    uuid=rp_uuid,
-                    traits=traits,
-                )
-
-            # Increment generation
-            result = tx.run(
-                """
-                MATCH (rp:ResourceProvider {uuid: $uuid})
-                SET rp.generation = rp.generation + 1,
-                    rp.updated_at = datetime()
-                RETURN rp.generation AS generation
-                """,
-                uuid=rp_uuid,
-            ).single()
-
-            tx.commit()
-        except (ValueError, TypeError, RuntimeError):
-            tx.rollback()
-            raise
+    # bool is an int subclass but not a valid generation
+    if not isinstance(generation, int) or isinstance(generation, bool):
+        raise errors.BadRequest("JSON does not validate")
+    names = data.get("traits", [])
+    if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+        raise errors.BadRequest("JSON does not validate")
+    # Drop duplicate names so each trait is linked once, and sort in place
+    # once for the response
+    traits: list[str] = list(dict.fromkeys(names))
+    traits.sort()
+
+    result = db.get_driver().execute_write(
+        _set_provider_traits, rp_uuid, generation, traits
+    )
+    _raise_for_provider_status(result["status"], rp_uuid)
+    # New trait names may have been created and associations changed
+    app_cache.clear_traits_cache()
 
     return flask.jsonify(
         {
             "resource_provider_generation": result["generation"],
-            "traits": sorted(traits),
+            "traits": traits,
         }
     ), 200
 
@@ -445,22 +588,9 @@ def delete_provider_traits(rp_uuid: str) -> flask.Response:
     :returns: Response with status 204
     """
     flask.g.context.can(trait_policies.RP_TRAIT_DELETE)
-    with _driver().session() as session:
-        provider = session.run(
-            "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp",
-            uuid=rp_uuid,
-        ).single()
-
-        if not provider:
-            raise errors.NotFound("Resource provider %s not found." % rp_uuid)
-
-        session.run(
-            """
-            MATCH (rp:ResourceProvider {uuid: $uuid})-[rel:HAS_TRAIT]->()
-            DELETE rel
-            """,
-            uuid=rp_uuid,
-        )
+    status = db.get_driver().execute_write(_delete_provider_traits, rp_uuid)
+    _raise_for_provider_status(status, rp_uuid)
+    app_cache.clear_traits_cache()
 
     return flask.Response(status=204)
 
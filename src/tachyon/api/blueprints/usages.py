@@ -7,14 +7,15 @@ Implements Placement-compatible usage reporting.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from email.utils import format_datetime
+import time
 from typing import Any
 
 import flask
+from werkzeug import http
 
 from oslo_log import log
 
+from tachyon.api import db
 from tachyon.api import errors
 from tachyon.api import microversion
 from tachyon.policies import usage as usage_policies
@@ -24,6 +25,67 @@ LOG = log.getLogger(__name__)
 bp = flask.Blueprint("usages", __name__)
 
 
+_PROVIDER_USAGES_QUERY = """
+MATCH (rp:ResourceProvider {uuid: $uuid})
+OPTIONAL MATCH (rp)-[:HAS_INVENTORY]->(inv)-[:OF_CLASS]->(rc:ResourceClass)
+OPTIONAL MATCH (inv)<-[alloc:CONSUMES]-()
+WITH rp, rc.name AS rc, COALESCE(sum(alloc.used), 0) AS used
+RETURN COALESCE(rp.generation, 0) AS generation,
+       collect(CASE WHEN rc IS NOT NULL THEN {rc: rc, used: used} END) AS usages
+"""
+
+# Project usage queries are assembled once at import time from these
+# fragments so each filter combination always sends identical Cypher text,
+# which lets Neo4j reuse its cached plan.
+_PROJECT_MATCH = (
+    "MATCH (c:Consumer)-[:OWNED_BY]->(proj:Project {external_id: $project_id})\n"
+)
+_USER_MATCH = "MATCH (c)-[:CREATED_BY]->(u:User {external_id: $user_id})\n"
+_TYPE_FILTER = "WHERE c.consumer_type = $consumer_type\n"
+# Consumers are counted per consumer type before their allocations are
+# expanded, so one statement yields both consumer_count and usages.
+_USAGE_BY_TYPE_RETURN = (
+    "WITH COALESCE(c.consumer_type, 'unknown') AS ctype,\n"
+    "     collect(DISTINCT c) AS consumers\n"
+    "UNWIND consumers AS c\n"
+    "OPTIONAL MATCH (c)-[alloc:CONSUMES]->(inv)-[:OF_CLASS]->(rc:ResourceClass)\n"
+    "WITH ctype, size(consumers) AS cnt, rc.name AS rc, sum(alloc.used) AS used\n"
+    "RETURN ctype, cnt, rc, used\n"
+)
+_USAGE_RETURN = (
+    "MATCH (c)-[alloc:CONSUMES]->(inv)-[:OF_CLASS]->(rc:ResourceClass)\n"
+    "RETURN rc.name AS rc, COALESCE(sum(alloc.used), 0) AS used\n"
+)
+
+
+def _project_query(has_user: bool, has_type: bool, tail: str) -> str:
+    """Assemble a project usage query from its fragments.
+
+    :param has_user: Whether to filter consumers by user
+    :param has_type: Whether to filter consumers by consumer type
+    :param tail: Aggregation and RETURN clauses
+    :returns: Cypher query string
+    """
+    return (
+        _PROJECT_MATCH
+        + (_USER_MATCH if has_user else "")
+        + (_TYPE_FILTER if has_type else "")
+        + tail
+    )
+
+
+# Keyed by (has_user, has_type)
+_USAGE_BY_TYPE_QUERIES = {
+    (u, t): _project_query(u, t, _USAGE_BY_TYPE_RETURN)
+    for u in (False, True)
+    for t in (False, True)
+}
+# Keyed by has_user; consumer type filtering is 1.38+ only
+_PROJECT_USAGES_QUERIES = {
+    u: _project_query(u, False, _USAGE_RETURN) for u in (False, True)
+}
+
+
 def _mv() -> microversion.Microversion:
     """Return the parsed microversion from the request context.
 
@@ -35,38 +97,90 @@ def _mv() -> microversion.Microversion:
     return mv
 
 
-def _httpdate(dt: datetime | None = None) -> str:
-    """Format a datetime as HTTP-date.
+# (epoch second, HTTP-date) of the last formatted timestamp. Last-Modified
+# only has one-second resolution, so the string is reused within a second.
+_last_httpdate: tuple[int, str] = (0, "")
 
-    :param dt: Datetime to format, or None for current time
-    :returns: HTTP-date formatted string
-    """
-    if dt is None:
-        dt = datetime.now(timezone.utc)
-    return format_datetime(dt, usegmt=True)
 
+def _httpdate() -> str:
+    """Return the current time as an HTTP-date.
 
-def _add_cache_headers(resp: flask.Response) -> flask.Response:
+    :returns: HTTP-date formatted string
+    """
+    global _last_httpdate
+    now = int(time.time())
+    cached = _last_httpdate
+    if cached[0] != now:
+        cached = (now, http.http_date(now))
+        _last_httpdate = cached
+    return cached[1]
+
+
+def _add_cache_headers(
+    resp: flask.Response, mv: microversion.Microversion
+) -> flask.Response:
     """Add cache control headers at microversion 1.15+.
 
     :param resp: Flask response object
+    :param mv: Request microversion, already looked up by the caller
     :returns: Response with cache headers
     """
-    mv = _mv()
     if mv.is_at_least(15):
         resp.headers["Cache-Control"] = "no-cache"
         resp.headers["Last-Modified"] = _httpdate()
     return resp
 
 
-def _driver() -> Any:
-    """Get the Neo4j driver from the Flask app.
+def _read_provider_usages(tx: Any, rp_uuid: str) -> Any:
+    """Read a provider's generation and per resource class usage.
+
+    :param tx: Neo4j managed transaction
+    :param rp_uuid: Resource provider UUID
+    :returns: Record with ``generation`` and ``usages``, or None if the
+        provider does not exist
+    """
+    return tx.run(_PROVIDER_USAGES_QUERY, uuid=rp_uuid).single()
+
 
-    :returns: Neo4j driver instance
+def _read_project_usages(tx: Any, query: str, params: dict[str, Any]) -> dict[str, int]:
+    """Read usages summed per resource class.
+
+    :param tx: Neo4j managed transaction
+    :param query: Cypher returning ``rc`` and ``used`` rows
+    :param params: Query parameters
+    :returns: Dict of resource class name to used amount
     """
-    from tachyon.api import app
+    return {row["rc"]: int(row["used"]) for row in tx.run(query, **params)}
+
 
-    return app.get_driver()
+def _read_usages_by_type(
+    tx: Any, query: str, params: dict[str, Any]
+) -> tuple[dict[str, int], dict[str, dict[str, Any]]]:
+    """Read consumer counts and usages grouped by consumer type.
+
+    Results are consumed inside the transaction function, as managed
+    transactions may be retried and their results are invalid once it ends.
+
+    :param tx: Neo4j managed transaction
+    :param query: Cypher returning ``ctype``, ``cnt``, ``rc`` and ``used``
+        rows, with a null ``rc`` for consumers without allocations
+    :param params: Query parameters
+    :returns: Tuple of (consumer counts by type, usages by type)
+    """
+    consumer_counts: dict[str, int] = {}
+    # Group by consumer_type - Placement uses dict keyed by consumer_type
+    # Format: {"usages": {"INSTANCE": {"consumer_count": 1, "VCPU": 2}}}
+    # Rows are consumed straight off the result cursor.
+    usages_by_type: dict[str, dict[str, Any]] = {}
+    for row in tx.run(query, **params):
+        ctype = row["ctype"]
+        consumer_counts[ctype] = row["cnt"]
+        if row["rc"] is None:
+            continue
+        if ctype not in usages_by_type:
+            usages_by_type[ctype] = {"consumer_count": row["cnt"]}
+        usages_by_type[ctype][row["rc"]] = int(row["used"])
+    return consumer_counts, usages_by_type
 
 
 @bp.route("/resource_providers/<string:rp_uuid>/usages", methods=["GET"])
@@ -82,36 +196,24 @@ def provider_usages(rp_uuid: str) -> tuple[flask.Response, int]:
     :returns: Tuple of (response, status_code)
     """
     flask.g.context.can(usage_policies.PROVIDER_USAGES)
+    mv = _mv()
 
-    with _driver().session() as session:
-        # Check provider exists
-        provider = session.run(
-            "MATCH (rp:ResourceProvider {uuid: $uuid}) RETURN rp",
-            uuid=rp_uuid,
-        ).single()
-
-        if not provider:
-            raise errors.NotFound("Resource provider %s not found." % rp_uuid)
-
-        rows = session.run(
-            """
-            MATCH (rp:ResourceProvider {uuid: $uuid})
-                  -[:HAS_INVENTORY]->(inv)
-                  -[:OF_CLASS]->(rc:ResourceClass)
-            OPTIONAL MATCH (inv)<-[alloc:CONSUMES]-()
-            RETURN rc.name AS rc, COALESCE(sum(alloc.used), 0) AS used
-            """,
-            uuid=rp_uuid,
-        )
-        usages = {row["rc"]: int(row["used"]) for row in rows}
+    # Provider generation and usages in one round trip; no row means the
+    # provider does not exist
+    result = db.get_driver().execute_read(_read_provider_usages, rp_uuid)
+
+    if not result:
+        raise errors.NotFound("Resource provider %s not found." % rp_uuid)
+
+    usages = {row["rc"]: int(row["used"]) for row in result["usages"]}
 
     resp = flask.jsonify(
         {
-            "resource_provider_generation": provider["rp"].get("generation", 0),
+            "resource_provider_generation": result["generation"],
             "usages": usages,
         }
     )
-    return _add_cache_headers(resp), 200
+    return _add_cache_headers(resp, mv), 200
 
 
 @bp.route("/usages", methods=["GET"])
@@ -139,7 +241,9 @@ def project_usages() -> tuple[flask.Response, int]:
 
     project_id = flask.request.args.get("project_id")
     user_id = flask.request.args.get("user_id")
-    consumer_type = flask.request.args.get("consumer_type") if mv.is_at_least(38) else None
+    # Checked once; the 1.38 grouping decides both parsing and the query
+    grouped = mv.is_at_least(38)
+    consumer_type = flask.request.args.get("consumer_type") if grouped else None
 
     if not project_id:
         raise errors.BadRequest("'project_id' is a required property")
@@ -147,88 +251,38 @@ def project_usages() -> tuple[flask.Response, int]:
     # Check policy with project_id as target for project-level access
     flask.g.context.can(usage_policies.TOTAL_USAGES, target={"project_id": project_id})
 
-    with _driver().session() as session:
-        if mv.is_at_least(38):
-            # At 1.38+, group usages by consumer_type with consumer_count
-            # Build dynamic query based on filters
-            base_match = """
-                MATCH (c:Consumer)-[:OWNED_BY]->(proj:Project {external_id: $project_id})
-            """
-            params: dict[str, Any] = {"project_id": project_id}
-
-            user_match = ""
-            if user_id:
-                user_match = """
-                MATCH (c)-[:CREATED_BY]->(u:User {external_id: $user_id})
-                """
-                params["user_id"] = user_id
-
-            type_filter = ""
-            if consumer_type and consumer_type != "all":
-                type_filter = """
-                WHERE c.consumer_type = $consumer_type
-                """
-                params["consumer_type"] = consumer_type
-
-            # First query: get consumer counts per consumer_type
-            count_query = base_match + user_match + type_filter + """
-                WITH COALESCE(c.consumer_type, 'unknown') AS ctype, count(DISTINCT c) AS cnt
-                RETURN ctype, cnt
-            """
-            count_rows = list(session.run(count_query, **params))
-            consumer_counts = {row["ctype"]: row["cnt"] for row in count_rows}
-
-            # Second query: get usages per consumer_type and resource class
-            usage_query = base_match + user_match + type_filter + """
-                MATCH (c)-[alloc:CONSUMES]->(inv)-[:OF_CLASS]->(rc:ResourceClass)
-                WITH COALESCE(c.consumer_type, 'unknown') AS ctype,
-                     rc.name AS rc, sum(alloc.used) AS used
-                RETURN ctype, rc, used
-            """
-            usage_rows = list(session.run(usage_query, **params))
-
-            # Group by consumer_type - Placement uses dict keyed by consumer_type
-            # Format: {"usages": {"INSTANCE": {"consumer_count": 1, "VCPU": 2}}}
-            usages_by_type: dict[str, dict[str, Any]] = {}
-            for row in usage_rows:
-                ctype = row["ctype"]
-                if ctype not in usages_by_type:
-                    usages_by_type[ctype] = {
-                        "consumer_count": consumer_counts.get(ctype, 0),
-                    }
-                usages_by_type[ctype][row["rc"]] = int(row["used"])
-
-            # Handle 'all' consumer_type - aggregate everything
-            if consumer_type == "all":
-                total_count = sum(consumer_counts.values())
-                total_usages: dict[str, int] = {}
-                for ctype, data in usages_by_type.items():
-                    for key, val in data.items():
-                        if key != "consumer_count":
-                            total_usages[key] = total_usages.get(key, 0) + val
-                usages_by_type = {"all": {"consumer_count": total_count, **total_usages}}
-
-            resp = flask.jsonify({"usages": usages_by_type})
-        else:
-            # Pre-1.38 behavior: simple aggregated usages
-            query = """
-                MATCH (c:Consumer)-[:OWNED_BY]->(proj:Project {external_id: $project_id})
-            """
-            params = {"project_id": project_id}
-
-            if user_id:
-                query += """
-                MATCH (c)-[:CREATED_BY]->(u:User {external_id: $user_id})
-                """
-                params["user_id"] = user_id
-
-            query += """
-                MATCH (c)-[alloc:CONSUMES]->(inv)-[:OF_CLASS]->(rc:ResourceClass)
-                RETURN rc.name AS rc, COALESCE(sum(alloc.used), 0) AS used
-            """
-
-            rows = session.run(query, **params)
-            usages = {row["rc"]: int(row["used"]) for row in rows}
-            resp = flask.jsonify({"usages": usages})
-
-    return _add_cache_headers(resp), 200
+    has_user = bool(user_id)
+    params: dict[str, Any] = {"project_id": project_id}
+    if has_user:
+        params["user_id"] = user_id
+
+    if grouped:
+        # At 1.38+, group usages by consumer_type with consumer_count
+        has_type = bool(consumer_type and consumer_type != "all")
+        if has_type:
+            params["consumer_type"] = consumer_type
+        consumer_counts, usages_by_type = db.get_driver().execute_read(
+            _read_usages_by_type,
+            _USAGE_BY_TYPE_QUERIES[has_user, has_type],
+            params,
+        )
+
+        # Handle 'all' consumer_type - aggregate everything
+        if consumer_type == "all":
+            total_count = sum(consumer_counts.values())
+            total_usages: dict[str, int] = {}
+            for ctype, data in usages_by_type.items():
+                for key, val in data.items():
+                    if key != "consumer_count":
+                        total_usages[key] = total_usages.get(key, 0) + val
+            usages_by_type = {"all": {"consumer_count": total_count, **total_usages}}
+
+        resp = flask.jsonify({"usages": usages_by_type})
+    else:
+        # Pre-1.38 behavior: simple aggregated usages
+        usages = db.get_driver().execute_read(
+            _read_project_usages, _PROJECT_USAGES_QUERIES[has_user], params
+        )
+        resp = flask.jsonify({"usages": usages})
+
+    return _add_cache_headers(resp, mv), 200
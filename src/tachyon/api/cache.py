@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process result caching for read-heavy Tachyon API endpoints.
+
+Traits are written rarely but read on nearly every scheduling decision.
+When ``[api] traits_cache_ttl`` is non-zero, trait lookups are cached per
+application and cleared on every trait write handled by this process.
+Other API workers do not see those writes until the entries expire, so
+the TTL bounds how stale a listing can be.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any
+
+import flask
+
+TRAITS_CACHE = "traits_cache"
+
+# Sentinel returned by TTLCache.get() on a miss, so None can be cached
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    :param maxsize: Maximum number of entries kept
+    :param ttl: Entry lifetime in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: collections.OrderedDict[Any, tuple[float, Any]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key.
+
+        :param key: Cache key
+        :returns: Cached value, or MISSING if absent or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full.
+
+        :param key: Cache key
+        :param value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def init_app(app: flask.Flask) -> None:
+    """Create the per-application caches enabled by configuration.
+
+    :param app: Flask application instance
+    """
+    ttl = app.config.get("TRAITS_CACHE_TTL")
+    if ttl:
+        app.extensions[TRAITS_CACHE] = TTLCache(maxsize=1024, ttl=ttl)
+
+
+def traits_cache() -> TTLCache | None:
+    """Return the current application's trait cache.
+
+    :returns: TTLCache instance, or None if trait caching is disabled
+    """
+    cache: TTLCache | None = flask.current_app.extensions.get(TRAITS_CACHE)
+    return cache
+
+
+def clear_traits_cache() -> None:
+    """Invalidate cached trait results after a trait write."""
+    cache = traits_cache()
+    if cache is not None:
+        cache.clear()
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Neo4j client access for API request handlers."""
+
+from __future__ import annotations
+
+import flask
+
+from tachyon.db import neo4j_api
+
+
+def get_driver() -> neo4j_api.Neo4jClient:
+    """Return the current application's Neo4j client.
+
+    The client is cached in the app's extensions, so the app module is only
+    imported to initialize it lazily on first use.
+
+    :returns: Neo4j client instance
+    """
+    driver: neo4j_api.Neo4jClient | None = flask.current_app.extensions.get(
+        "neo4j_driver"
+    )
+    if driver is None:
+        # Deferred: the app module imports every blueprint
+        from tachyon.api import app
+
+        driver = app.get_driver()
+    return driver
@@ -24,12 +24,18 @@ http://specs.openstack.org/openstack/api-wg/guidelines/errors.html
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
 from typing import Any
 
 import flask
+import orjson
 
 from oslo_log import log
 
+if TYPE_CHECKING:
+    from tachyon import policy
+
 LOG = log.getLogger(__name__)
 
 # Error code constants - match Placement API exactly
@@ -49,12 +55,107 @@ QUERYPARAM_MISSING_VALUE = "placement.query.missing_value"
 def _should_include_error_code() -> bool:
     """Check if error codes should be included based on microversion.
 
-    Error codes are only included at microversion 1.23+.
+    Error codes are only included at microversion 1.23+. The answer is
+    kept on ``flask.g`` once the microversion is known, so requests that
+    render several errors only check it once.
+    """
+    include: bool | None = flask.g.get("_include_error_code")
+    if include is None:
+        mv = flask.g.get("microversion")
+        if mv is None:
+            return False
+        include = flask.g._include_error_code = mv.is_at_least(23)
+    return include
+
+
+@functools.lru_cache(maxsize=128)
+def _error_body_parts(status: int, title: str, code: str | None) -> tuple[bytes, bytes]:
+    """Return the pre-encoded JSON surrounding an error's detail.
+
+    Error bodies only vary by detail once the class is known, so the rest
+    is encoded once. Keys are in sorted order, matching ``flask.jsonify``.
+
+    :param status: HTTP status code
+    :param title: Short error title
+    :param code: Error code to include, or None
+    :returns: Tuple of (bytes before detail, bytes after detail)
+    """
+    prefix = b'{"errors":[{'
+    if code is not None:
+        prefix += b'"code":' + orjson.dumps(code) + b","
+    prefix += b'"detail":'
+    suffix = b',"status":%d,"title":%s}]}\n' % (status, orjson.dumps(title))
+    return prefix, suffix
+
+
+def _encode_error(
+    status: int, title: str, detail: str, code: str | None = None
+) -> bytes:
+    """Encode a Placement-compatible JSON error body.
+
+    :param status: HTTP status code
+    :param title: Short error title
+    :param detail: Detailed error message
+    :param code: Error code to include, or None
+    :returns: JSON body bytes
+    """
+    prefix, suffix = _error_body_parts(status, title, code)
+    return prefix + orjson.dumps(detail) + suffix
+
+
+def _error_response(body: bytes, status: int) -> flask.Response:
+    """Wrap an encoded error body in a JSON response.
+
+    :param body: JSON body bytes
+    :param status: HTTP status code
+    :returns: JSON response with the given status
+    """
+    response: flask.Response = flask.current_app.response_class(
+        body, status=status, mimetype="application/json"
+    )
+    return response
+
+
+def _json_error(
+    status: int, title: str, detail: str, code: str | None = None
+) -> flask.Response:
+    """Build a Placement-compatible JSON error response.
+
+    :param status: HTTP status code
+    :param title: Short error title
+    :param detail: Detailed error message
+    :param code: Error code to include, or None
+    :returns: JSON response with the given status
+    """
+    return _error_response(_encode_error(status, title, detail, code), status)
+
+
+# Errors raised by Flask/Werkzeug whose message never varies; their whole
+# body is encoded once at import time.
+_GENERIC_ERRORS = {
+    400: ("Bad Request", "The request is invalid."),
+    404: ("Not Found", "The resource could not be found."),
+    406: ("Not Acceptable", "Only application/json is provided"),
+    409: ("Conflict", "A conflict occurred with the current state."),
+    500: ("Internal Server Error", "An unexpected error occurred."),
+}
+_GENERIC_BODIES = {
+    status: _encode_error(status, title, detail)
+    for status, (title, detail) in _GENERIC_ERRORS.items()
+}
+
+
+def _generic_error(status: int) -> flask.Response:
+    """Return the pre-encoded response for a generic HTTP error.
+
+    :param status: HTTP status code, one of ``_GENERIC_ERRORS``
+    :returns: JSON response with the given status
     """
-    mv = getattr(flask.g, "microversion", None)
-    if mv is None:
-        return False
-    return mv.is_at_least(23)
+    return _error_response(_GENERIC_BODIES[status], status)
+
+
+# Default msg_fmt of errors whose message is just the reason given
+_REASON_ONLY = "%(reason)s"
 
 
 class TachyonException(Exception):
@@ -69,7 +170,7 @@ class TachyonException(Exception):
     :ivar code: Optional programmatic error code
     """
 
-    msg_fmt = "%(reason)s"
+    msg_fmt = _REASON_ONLY
     status_code = 500
     title = "Internal Server Error"
     code: str | None = None
@@ -89,35 +190,31 @@ class TachyonException(Exception):
             self.kwargs["reason"] = reason
 
         # Format the message using msg_fmt and kwargs
-        try:
-            self.detail = self.msg_fmt % self.kwargs
-        except (KeyError, TypeError):
-            # Fallback if formatting fails
-            if reason:
-                self.detail = reason
-            else:
-                self.detail = self.msg_fmt
+        if self.msg_fmt == _REASON_ONLY and reason is not None:
+            # Plain BadRequest("...") style errors: the reason is the message
+            self.detail = str(reason)
+        else:
+            try:
+                self.detail = self.msg_fmt % self.kwargs
+            except (KeyError, TypeError):
+                # Fallback if formatting fails
+                if reason:
+                    self.detail = reason
+                else:
+                    self.detail = self.msg_fmt
 
         super().__init__(self.detail)
 
-    def to_response(self) -> tuple[flask.Response, int]:
+    def to_response(self) -> flask.Response:
         """Convert exception to a Placement-compatible JSON response.
 
         Error codes are only included at microversion 1.23+.
 
-        :returns: Tuple of (JSON response, status code)
+        :returns: JSON response with the error's status code
         """
-        error: dict[str, Any] = {
-            "status": self.status_code,
-            "title": self.title,
-            "detail": self.detail,
-        }
         # Error codes only at microversion 1.23+
-        if self.code and _should_include_error_code():
-            error["code"] = self.code
-
-        body = {"errors": [error]}
-        return flask.jsonify(body), self.status_code
+        code = self.code if self.code and _should_include_error_code() else None
+        return _json_error(self.status_code, self.title, self.detail, code)
 
 
 # Backward compatibility alias
@@ -204,7 +301,7 @@ class BadRequest(TachyonException):
         raise BadRequest(field="name", error="is required")
     """
 
-    msg_fmt = "%(reason)s"
+    msg_fmt = _REASON_ONLY
     status_code = 400
     title = "Bad Request"
 
@@ -332,24 +429,88 @@ class DuplicateUUID(Conflict):
     msg_fmt = "Conflicting %(resource_type)s uuid: %(uuid)s already exists"
 
 
-def error_response(status: int, title: str, detail: str) -> tuple[flask.Response, int]:
+def error_response(status: int, title: str, detail: str) -> flask.Response:
     """Create a Placement-compatible error response.
 
     :param status: HTTP status code
     :param title: Short error title
     :param detail: Detailed error message
-    :returns: Tuple of (JSON response, status code)
+    :returns: JSON response with the given status
     """
-    body = {
-        "errors": [
-            {
-                "status": status,
-                "title": title,
-                "detail": detail,
-            }
-        ]
-    }
-    return flask.jsonify(body), status
+    return _json_error(status, title, detail)
+
+
+def _handle_tachyon_error(error: TachyonException) -> flask.Response:
+    """Handle TachyonException subclasses."""
+    LOG.debug("Handling %s: %s", type(error).__name__, error.detail)
+    return error.to_response()
+
+
+@functools.lru_cache(maxsize=256)
+def _policy_error_body(action: str) -> bytes:
+    """Return the encoded 403 body for a denied policy action.
+
+    Actions come from the bounded set of registered policy rules, so
+    each body is only encoded once.
+
+    :param action: The policy action that was denied
+    :returns: JSON body bytes
+    """
+    cls = PolicyNotAuthorized
+    detail = cls.msg_fmt % {"action": action}
+    return _encode_error(cls.status_code, cls.title, detail)
+
+
+def _handle_policy_error(
+    error: policy.PolicyNotAuthorized,
+) -> flask.Response:
+    """Handle policy authorization failures."""
+    LOG.debug("Policy not authorized: %s", error.action)
+    return _error_response(
+        _policy_error_body(error.action), PolicyNotAuthorized.status_code
+    )
+
+
+def _not_found(error: Exception) -> flask.Response:
+    return _generic_error(404)
+
+
+def _conflict(error: Exception) -> flask.Response:
+    return _generic_error(409)
+
+
+def _bad_request(error: Exception) -> flask.Response:
+    return _generic_error(400)
+
+
+def _method_not_allowed(error: Exception) -> flask.Response:
+    method = flask.request.method
+    resp = error_response(
+        405,
+        "Method Not Allowed",
+        "The method %s is not allowed for this resource." % method,
+    )
+    if hasattr(error, "valid_methods") and error.valid_methods:
+        resp.headers["Allow"] = ", ".join(sorted(error.valid_methods))
+    return resp
+
+
+def _not_acceptable(error: Exception) -> flask.Response:
+    return _generic_error(406)
+
+
+def _unsupported_media_type(error: Exception) -> flask.Response:
+    content_type = flask.request.content_type
+    return error_response(
+        415,
+        "Unsupported Media Type",
+        "The media type %s is not supported, use application/json" % content_type,
+    )
+
+
+def _internal_error(error: Exception) -> flask.Response:
+    LOG.exception("Internal server error")
+    return _generic_error(500)
 
 
 def register_handlers(app: flask.Flask) -> None:
@@ -361,66 +522,12 @@ def register_handlers(app: flask.Flask) -> None:
     from tachyon import policy
 
     LOG.debug("Registering error handlers")
-
-    @app.errorhandler(TachyonException)
-    def handle_tachyon_error(error: TachyonException) -> tuple[flask.Response, int]:
-        """Handle TachyonException subclasses."""
-        LOG.debug("Handling %s: %s", type(error).__name__, error.detail)
-        return error.to_response()
-
-    @app.errorhandler(policy.PolicyNotAuthorized)
-    def handle_policy_error(
-        error: policy.PolicyNotAuthorized,
-    ) -> tuple[flask.Response, int]:
-        """Handle policy authorization failures."""
-        LOG.debug("Policy not authorized: %s", error.action)
-        api_error = PolicyNotAuthorized(action=error.action)
-        return api_error.to_response()
-
-    @app.errorhandler(404)
-    def not_found(error: Exception) -> tuple[flask.Response, int]:
-        return error_response(404, "Not Found", "The resource could not be found.")
-
-    @app.errorhandler(409)
-    def conflict(error: Exception) -> tuple[flask.Response, int]:
-        return error_response(
-            409, "Conflict", "A conflict occurred with the current state."
-        )
-
-    @app.errorhandler(400)
-    def bad_request(error: Exception) -> tuple[flask.Response, int]:
-        return error_response(400, "Bad Request", "The request is invalid.")
-
-    @app.errorhandler(405)
-    def method_not_allowed(error: Exception) -> tuple[flask.Response, int]:
-        method = flask.request.method
-        resp, status = error_response(
-            405,
-            "Method Not Allowed",
-            "The method %s is not allowed for this resource." % method,
-        )
-        if hasattr(error, "valid_methods") and error.valid_methods:
-            resp.headers["Allow"] = ", ".join(sorted(error.valid_methods))
-        return resp, status
-
-    @app.errorhandler(406)
-    def not_acceptable(error: Exception) -> tuple[flask.Response, int]:
-        return error_response(
-            406, "Not Acceptable", "Only application/json is provided"
-        )
-
-    @app.errorhandler(415)
-    def unsupported_media_type(error: Exception) -> tuple[flask.Response, int]:
-        content_type = flask.request.content_type
-        return error_response(
-            415,
-            "Unsupported Media Type",
-            "The media type %s is not supported, use application/json" % content_type,
-        )
-
-    @app.errorhandler(500)
-    def internal_error(error: Exception) -> tuple[flask.Response, int]:
-        LOG.exception("Internal server error")
-        return error_response(
-            500, "Internal Server Error", "An unexpected error occurred."
-        )
+    app.register_error_handler(TachyonException, _handle_tachyon_error)
+    app.register_error_handler(policy.PolicyNotAuthorized, _handle_policy_error)
+    app.register_error_handler(404, _not_found)
+    app.register_error_handler(409, _conflict)
+    app.register_error_handler(400, _bad_request)
+    app.register_error_handler(405, _method_not_allowed)
+    app.register_error_handler(406, _not_acceptable)
+    app.register_error_handler(415, _unsupported_media_type)
+    app.register_error_handler(500, _internal_error)
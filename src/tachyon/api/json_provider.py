@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""orjson-backed JSON provider for the Tachyon Flask application.
+
+Replaces Flask's stdlib ``json`` provider so that every ``flask.jsonify``
+call serializes through orjson. Output matches the default provider:
+compact separators, sorted keys and a trailing newline. Unlike
+``json.dumps``, integers too large for 64 bits are rejected.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import decimal
+from typing import Any
+import uuid
+
+import flask
+from flask.json import provider
+import orjson
+from werkzeug import http
+
+# Sorted keys and passing dates through to _default keep responses
+# byte-compatible with Flask's default provider. Non-string keys are
+# converted like json.dumps does instead of raising TypeError.
+_DUMPS_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+)
+_RESPONSE_OPTIONS = _DUMPS_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively.
+
+    Mirrors Flask's default provider: dates become HTTP dates, decimals and
+    UUIDs strings, dataclasses dicts, and objects with ``__html__`` their
+    markup.
+
+    :param obj: Object to serialize
+    :returns: JSON-serializable value
+    :raises TypeError: If the object cannot be serialized
+    """
+    if isinstance(obj, datetime.date):
+        if not isinstance(obj, datetime.datetime):
+            obj = datetime.datetime.combine(
+                obj, datetime.time(), tzinfo=datetime.timezone.utc
+            )
+        return http.http_date(obj)
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(provider.JSONProvider):
+    """JSON provider that serializes with orjson."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON to a string.
+
+        :param obj: The data to serialize
+        :param kwargs: Ignored; orjson does not accept json.dumps options
+        :returns: JSON string
+        """
+        return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize data as JSON from a string or bytes.
+
+        :param s: Text or UTF-8 bytes
+        :param kwargs: Ignored; orjson does not accept json.loads options
+        :returns: Deserialized data
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        """Serialize the arguments as JSON and return a Response.
+
+        The encoded bytes are handed to the response directly, skipping
+        the ``str`` round trip.
+
+        :param args: A single value to serialize, or multiple values to
+            treat as a list
+        :param kwargs: Treat as a dict to serialize
+        :returns: flask.Response with ``application/json`` mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=_RESPONSE_OPTIONS)
+        return flask.current_app.response_class(body, mimetype=self.mimetype)
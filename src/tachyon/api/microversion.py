@@ -8,7 +8,7 @@ Backed by the upstream ``microversion-parse`` library for correctness.
 from __future__ import annotations
 
 import dataclasses
-import re
+import functools
 
 import microversion_parse
 from oslo_log import log
@@ -39,7 +39,7 @@ class MicroversionNotAcceptable(Exception):
         super().__init__(f"Unacceptable version header: {version_string}")
 
 
-@dataclasses.dataclass(frozen=True, order=True)
+@dataclasses.dataclass(frozen=True, order=True, slots=True)
 class Microversion:
     """Parsed microversion consisting of major/minor components.
 
@@ -59,28 +59,53 @@ class Microversion:
         return self.minor >= minor
 
 
+# Shared instances for every version parse can return, indexed by minor
+_SUPPORTED: tuple[Microversion, ...] = tuple(
+    Microversion(1, minor) for minor in range(MAX_SUPPORTED_MINOR + 1)
+)
+_LATEST = Microversion(1, LATEST_MINOR)
+
+
 def _extract(header_value: str | None) -> str | None:
-    """Use microversion-parse to extract the version string from headers.
+    """Extract the placement version string from the header value.
+
+    A single ``placement <version>`` value is parsed directly; headers
+    listing several services are left to microversion-parse.
 
     :param header_value: Value of the OpenStack-API-Version header
     :returns: Version string or None
     """
-    headers: dict[str, str] = {}
-    if header_value:
-        headers["openstack-api-version"] = header_value
+    if not header_value:
+        return None
+
+    if "," not in header_value:
+        try:
+            service, version = header_value.split(None, 1)
+        except ValueError:
+            return None
+        if service.lower() != "placement":
+            return None
+        return version.strip()
 
     try:
-        return microversion_parse.get_version(headers, service_type="placement")
+        return microversion_parse.get_version(
+            {"openstack-api-version": header_value}, service_type="placement"
+        )
     except (TypeError, ValueError):
         return None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_with_validation(header_value: str | None) -> Microversion:
     """Parse the OpenStack-API-Version header with validation.
 
     This function validates the version string format and ensures
     the version is within the supported range.
 
+    Clients send a handful of distinct header values, so successful parses
+    are memoized; Microversion is immutable and safe to share. Rejected
+    headers raise and are not cached.
+
     :param header_value: Value of the OpenStack-API-Version header
     :returns: Microversion instance
     :raises MicroversionParseError: If version string is malformed
@@ -88,22 +113,20 @@ def parse_with_validation(header_value: str | None) -> Microversion:
     """
     version_str = _extract(header_value)
     if not version_str:
-        return Microversion(1, 0)
+        return _SUPPORTED[0]
 
     if version_str.lower() == "latest":
-        return Microversion(1, LATEST_MINOR)
+        return _LATEST
 
     # Check for valid version format: must be X.Y where X and Y are integers
-    # This catches things like "pony.horse", "1.2.3", etc.
-    if not re.match(r"^\d+\.\d+$", version_str):
+    # This catches things like "pony.horse", "1.2.3", etc. isdecimal()
+    # accepts exactly the digits int() does, so no regex or library
+    # parsing is needed.
+    major_str, _dot, minor_str = version_str.partition(".")
+    if not (major_str.isdecimal() and minor_str.isdecimal()):
         raise MicroversionParseError(version_str)
-
-    try:
-        version_tuple = microversion_parse.parse_version_string(version_str)
-        major = int(version_tuple.major)
-        minor = int(version_tuple.minor)
-    except (TypeError, ValueError, AttributeError) as e:
-        raise MicroversionParseError(version_str) from e
+    major = int(major_str)
+    minor = int(minor_str)
 
     # Validate version is in supported range
     # Placement only supports major version 1
@@ -113,7 +136,7 @@ def parse_with_validation(header_value: str | None) -> Microversion:
     if minor < MIN_SUPPORTED_MINOR or minor > MAX_SUPPORTED_MINOR:
         raise MicroversionNotAcceptable(version_str)
 
-    return Microversion(major, minor)
+    return _SUPPORTED[minor]
 
 
 def parse(header_value: str | None) -> Microversion:
@@ -128,7 +151,7 @@ def parse(header_value: str | None) -> Microversion:
     try:
         return parse_with_validation(header_value)
     except (MicroversionParseError, MicroversionNotAcceptable):
-        return Microversion(1, 0)
+        return _SUPPORTED[0]
 
 
 def min_version_string() -> str:
@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import functools
+
 import flask
-import werkzeug
 
 from oslo_log import log
 
@@ -16,6 +17,28 @@ from tachyon import context as tachyon_context
 LOG = log.getLogger(__name__)
 
 
+# Microversion assumed when none is given or the header is rejected
+_DEFAULT_MICROVERSION = microversion.Microversion(1, 0)
+_DEFAULT_MICROVERSION_HEADER = "placement 1.0"
+
+# Response header values for every supported minor (major is fixed at 1);
+# "latest" reports the maximum supported version.
+_MICROVERSION_HEADERS = {
+    minor: "placement 1.%d" % minor
+    for minor in range(microversion.MAX_SUPPORTED_MINOR + 1)
+}
+_MICROVERSION_HEADERS[microversion.LATEST_MINOR] = _MICROVERSION_HEADERS[
+    microversion.MAX_SUPPORTED_MINOR
+]
+
+# Methods whose requests may carry a JSON body
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+_JSON_MEDIA_TYPE = "application/json"
+
+# Media ranges in an Accept header that allow a JSON response
+_JSON_MEDIA_TYPES = frozenset(("application/json", "*/*", "application/*"))
+
+
 def _accepts_json() -> bool:
     """Check if the client accepts application/json.
 
@@ -27,171 +50,224 @@ def _accepts_json() -> bool:
     if not accept:
         return True  # No Accept header means accept anything
 
+    # Most clients send exactly one of the accepted media types
+    if accept in _JSON_MEDIA_TYPES:
+        return True
+
+    return _media_ranges_allow_json(accept)
+
+
+@functools.lru_cache(maxsize=64)
+def _media_ranges_allow_json(accept: str) -> bool:
+    """Check if an Accept header lists a media range that allows JSON.
+
+    Clients send a handful of distinct Accept values, so the result is
+    memoized.
+
+    :param accept: Non-empty Accept header value
+    :returns: True if JSON is acceptable
+    """
     # Parse Accept header - simplified but handles common cases
-    parts = accept.lower().split(",")
-    for part in parts:
-        media_type = part.split(";")[0].strip()
-        if media_type in ("application/json", "*/*", "application/*"):
+    for part in accept.lower().split(","):
+        if part.partition(";")[0].strip() in _JSON_MEDIA_TYPES:
             return True
     return False
 
 
-def register(app: flask.Flask) -> None:
-    """Register middleware for auth and microversion handling.
+@functools.lru_cache(maxsize=64)
+def _parse_roles(roles_header: str) -> tuple[str, ...]:
+    """Split an X-Roles header into role names.
 
-    :param app: Flask application instance
+    Clients send a handful of distinct role lists, so the parsed result
+    is memoized.
+
+    :param roles_header: Comma-separated role names
+    :returns: Tuple of non-empty, stripped role names
     """
-    LOG.debug("Registering middleware")
+    return tuple(r for r in (p.strip() for p in roles_header.split(",")) if r)
 
-    @app.before_request
-    def _set_context() -> None:
-        """Set request context from WSGI environ or create from headers.
-
-        The auth middleware (TachyonKeystoneContext) places the context in
-        the WSGI environ as 'tachyon.context'. If running without the WSGI
-        middleware stack (e.g., Flask dev server or functional tests),
-        create the context from request headers.
-
-        Supports noauth2 mode: if X-Auth-Token is present but X-User-Id is not,
-        parse user/project from the token and set appropriate roles.
-        """
-        # Try to get context from WSGI environ (set by auth middleware)
-        ctx = flask.request.environ.get("tachyon.context")
-
-        if ctx is None:
-            # Create context from request headers (Flask dev server case)
-            # This is primarily for development/testing
-            user_id = flask.request.headers.get("X-User-Id")
-            project_id = flask.request.headers.get("X-Project-Id")
-            roles_header = flask.request.headers.get("X-Roles", "")
-
-            # Handle noauth2 mode: parse token if X-User-Id not provided
-            if user_id is None and "X-Auth-Token" in flask.request.headers:
-                token = flask.request.headers["X-Auth-Token"]
-                user_id, _sep, project_id_from_token = token.partition(":")
-                project_id = project_id or project_id_from_token or user_id
-                # Set admin roles for "admin" token (noauth2 convention)
-                if not roles_header:
-                    if user_id == "admin":
-                        roles_header = "admin,member,reader"
-                    else:
-                        roles_header = "member,reader"
-
-            roles = [r.strip() for r in roles_header.split(",") if r.strip()]
-
-            ctx = tachyon_context.RequestContext(
-                user_id=user_id,
-                project_id=project_id,
-                roles=roles,
-            )
 
-        flask.g.context = ctx
-
-    @app.before_request
-    def _set_microversion() -> flask.Response | None:
-        """Parse and set microversion from request headers.
-
-        Returns 400 Bad Request for malformed version strings.
-        Returns 406 Not Acceptable for unsupported versions.
-        """
-        header = flask.request.headers.get("OpenStack-API-Version")
-
-        try:
-            flask.g.microversion = microversion.parse_with_validation(header)
-            flask.g.microversion_header = header or "placement 1.0"
-            return None
-        except microversion.MicroversionParseError as e:
-            # 400 Bad Request for malformed version strings
-            flask.g.microversion = microversion.Microversion(1, 0)
-            flask.g.microversion_header = "placement 1.0"
-            body = {
-                "errors": [
-                    {
-                        "status": 400,
-                        "title": "Bad Request",
-                        "detail": f"invalid version string: {e.version_string}",
-                    }
-                ]
-            }
-            response = flask.jsonify(body)
-            response.status_code = 400
-            return response
-        except microversion.MicroversionNotAcceptable as e:
-            # 406 Not Acceptable for unsupported versions
-            flask.g.microversion = microversion.Microversion(1, 0)
-            flask.g.microversion_header = "placement 1.0"
-
-            # Check Accept header to determine response format
-            accept = flask.request.headers.get("Accept", "")
-            if "text/html" in accept.lower():
-                response = flask.Response(
-                    f"Unacceptable version header: {e.version_string}",
-                    status=406,
-                    content_type="text/html",
-                )
-            else:
-                body = {
-                    "errors": [
-                        {
-                            "status": 406,
-                            "title": "Not Acceptable",
-                            "detail": f"Unacceptable version header: {e.version_string}",
-                        }
-                    ]
-                }
-                response = flask.jsonify(body)
-                response.status_code = 406
-
-            return response
-
-    @app.after_request
-    def _add_microversion_headers(response: flask.Response) -> flask.Response:
-        """Add microversion response headers."""
-        mv = getattr(flask.g, "microversion", microversion.Microversion(1, 0))
-        # When "latest" was requested, report the actual max version
-        minor = mv.minor
-        if minor == microversion.LATEST_MINOR:
-            minor = microversion.MAX_SUPPORTED_MINOR
-        response.headers["OpenStack-API-Version"] = "placement %s.%s" % (
-            mv.major,
-            minor,
+def _set_context(request: flask.Request) -> None:
+    """Set request context from WSGI environ or create from headers.
+
+    The auth middleware (TachyonKeystoneContext) places the context in
+    the WSGI environ as 'tachyon.context'. If running without the WSGI
+    middleware stack (e.g., Flask dev server or functional tests),
+    create the context from request headers.
+
+    Supports noauth2 mode: if X-Auth-Token is present but X-User-Id is not,
+    parse user/project from the token and set appropriate roles.
+
+    :param request: The current request
+    """
+    # Try to get context from WSGI environ (set by auth middleware)
+    ctx = request.environ.get("tachyon.context")
+
+    if ctx is None:
+        # Create context from request headers (Flask dev server case)
+        # This is primarily for development/testing
+        headers = request.headers
+        user_id = headers.get("X-User-Id")
+        project_id = headers.get("X-Project-Id")
+        roles_header = headers.get("X-Roles", "")
+
+        # Handle noauth2 mode: parse token if X-User-Id not provided
+        if user_id is None and "X-Auth-Token" in headers:
+            token = headers["X-Auth-Token"]
+            user_id, _sep, project_id_from_token = token.partition(":")
+            project_id = project_id or project_id_from_token or user_id
+            # Set admin roles for "admin" token (noauth2 convention)
+            if not roles_header:
+                if user_id == "admin":
+                    roles_header = "admin,member,reader"
+                else:
+                    roles_header = "member,reader"
+
+        roles = list(_parse_roles(roles_header))
+
+        ctx = tachyon_context.RequestContext(
+            user_id=user_id,
+            project_id=project_id,
+            roles=roles,
+        )
+
+    flask.g.context = ctx
+
+
+def _set_microversion(request: flask.Request) -> flask.Response | None:
+    """Parse and set microversion from request headers.
+
+    :param request: The current request
+    :returns: 400 Bad Request for malformed version strings, 406 Not
+        Acceptable for unsupported versions, otherwise None
+    """
+    header = request.headers.get("OpenStack-API-Version")
+    if header is None:
+        # Most clients send no version and get the minimum
+        flask.g.microversion = _DEFAULT_MICROVERSION
+        flask.g.microversion_header = _DEFAULT_MICROVERSION_HEADER
+        return None
+
+    try:
+        flask.g.microversion = microversion.parse_with_validation(header)
+        flask.g.microversion_header = header or _DEFAULT_MICROVERSION_HEADER
+        return None
+    except microversion.MicroversionParseError as e:
+        # 400 Bad Request for malformed version strings
+        flask.g.microversion = _DEFAULT_MICROVERSION
+        flask.g.microversion_header = _DEFAULT_MICROVERSION_HEADER
+        response = errors.error_response(
+            400, "Bad Request", f"invalid version string: {e.version_string}"
         )
-        response.headers["Vary"] = "openstack-api-version"
         return response
+    except microversion.MicroversionNotAcceptable as e:
+        # 406 Not Acceptable for unsupported versions
+        flask.g.microversion = _DEFAULT_MICROVERSION
+        flask.g.microversion_header = _DEFAULT_MICROVERSION_HEADER
+
+        # Check Accept header to determine response format
+        accept = request.headers.get("Accept", "")
+        if "text/html" in accept.lower():
+            response = flask.Response(
+                f"Unacceptable version header: {e.version_string}",
+                status=406,
+                content_type="text/html",
+            )
+        else:
+            response = errors.error_response(
+                406,
+                "Not Acceptable",
+                f"Unacceptable version header: {e.version_string}",
+            )
 
-    @app.before_request
-    def _check_accept() -> None:
-        """Validate Accept header for JSON responses."""
-        # Skip check for root endpoint
-        if flask.request.path == "/":
-            return
-
-        # Check if this path matches a valid route - if not, let it 404
-        adapter = app.url_map.bind("")
-        try:
-            adapter.match(flask.request.path, method=flask.request.method)
-        except werkzeug.exceptions.HTTPException:
-            # Route doesn't exist, let it 404 naturally
-            return
-
-        if not _accepts_json():
-            flask.abort(406)
-
-    @app.before_request
-    def _check_content_type() -> None:
-        """Validate Content-Type header for requests with bodies."""
-        # Only check for methods that typically have bodies
-        if flask.request.method in ("POST", "PUT", "PATCH"):
-            content_type = flask.request.content_type or ""
-            content_length = flask.request.content_length
-
-            # If there's content, check the content type
-            if content_length and content_length > 0:
-                if not content_type:
-                    raise errors.BadRequest(
-                        "content-type header required when body is present"
-                    )
-
-                # Check if it's application/json
-                if not content_type.startswith("application/json"):
-                    flask.abort(415)
+        return response
+
+
+def _check_accept(request: flask.Request) -> None:
+    """Validate Accept header for JSON responses.
+
+    :param request: The current request
+    """
+    # Flask has already routed the request; if no route matched, let
+    # the routing error (404/405) be raised naturally
+    if request.url_rule is None:
+        return
+
+    if not _accepts_json():
+        flask.abort(406)
+
+
+def _check_content_type(request: flask.Request) -> None:
+    """Validate Content-Type header for requests with bodies.
+
+    :param request: The current request
+    """
+    # Only check for methods that typically have bodies
+    if request.method not in _BODY_METHODS:
+        return
+
+    # Bodyless requests are decided from the raw environ value; anything
+    # else goes through Werkzeug's parsing for its exact semantics
+    environ = request.environ
+    if environ.get("CONTENT_LENGTH", "0") in ("", "0"):
+        return
+    content_length = request.content_length
+    if not content_length or content_length <= 0:
+        return
+
+    # There's content, so check the content type
+    content_type = environ.get("CONTENT_TYPE", "")
+    if not content_type:
+        raise errors.BadRequest("content-type header required when body is present")
+
+    # Check if it's application/json
+    if not content_type.startswith(_JSON_MEDIA_TYPE):
+        flask.abort(415)
+
+
+def _preprocess_request() -> flask.Response | None:
+    """Run the request checks in order from a single before_request hook.
+
+    The request proxy is resolved once and handed to each step, rather
+    than Flask dispatching a hook per step.
+
+    :returns: Error response to short-circuit the request, or None
+    """
+    request = flask.request._get_current_object()  # type: ignore[attr-defined]
+    if request.path == "/":
+        # Version discovery needs no identity, Accept or body checks, only
+        # the negotiated microversion
+        return _set_microversion(request)
+
+    _set_context(request)
+    response = _set_microversion(request)
+    if response is not None:
+        return response
+    _check_accept(request)
+    _check_content_type(request)
+    return None
+
+
+def _add_microversion_headers(response: flask.Response) -> flask.Response:
+    """Add microversion response headers.
+
+    :param response: The outgoing response
+    :returns: The response with microversion headers set
+    """
+    mv = flask.g.get("microversion", _DEFAULT_MICROVERSION)
+    header = _MICROVERSION_HEADERS.get(mv.minor)
+    if header is None:
+        header = "placement %s.%s" % (mv.major, mv.minor)
+    response.headers["OpenStack-API-Version"] = header
+    response.headers["Vary"] = "openstack-api-version"
+    return response
+
+
+def register(app: flask.Flask) -> None:
+    """Register middleware for auth and microversion handling.
+
+    :param app: Flask application instance
+    """
+    LOG.debug("Registering middleware")
+    app.before_request(_preprocess_request)
+    app.after_request(_add_microversion_headers)
@@ -10,14 +10,13 @@ Provides authentication middleware following the Placement API pattern:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 from typing import Callable
 
 from keystonemiddleware import auth_token
 from oslo_log import log as logging
 from oslo_middleware import request_id
-import webob
-import webob.dec
 import webob.exc
 
 from tachyon import context
@@ -27,7 +26,27 @@ LOG = logging.getLogger(__name__)
 # Type aliases for WSGI
 WSGIEnviron = dict[str, Any]
 StartResponse = Callable[[str, list[tuple[str, str]]], Callable[[bytes], None]]
-WSGIApp = Callable[[WSGIEnviron, StartResponse], list[bytes]]
+WSGIApp = Callable[[WSGIEnviron, StartResponse], Iterable[bytes]]
+
+# PATH_INFO values of the root (version discovery) endpoint
+_ROOT_PATHS = frozenset(("/", ""))
+
+# Flattened X-Roles header values noauth2 assigns when none are given
+_ADMIN_ROLES = "admin,member,reader"
+_MEMBER_ROLES = "member,reader"
+
+
+def _unauthorized(
+    environ: WSGIEnviron, start_response: StartResponse
+) -> Iterable[bytes]:
+    """Reject the request with 401 Unauthorized.
+
+    :param environ: WSGI environ dictionary
+    :param start_response: WSGI start_response callable
+    :returns: Response body
+    """
+    body: Iterable[bytes] = webob.exc.HTTPUnauthorized()(environ, start_response)
+    return body
 
 
 class Middleware:
@@ -59,65 +78,73 @@ class NoAuthMiddleware(Middleware):
         """
         self.application = application
 
-    @webob.dec.wsgify
-    def __call__(self, req: webob.Request) -> webob.Response | WSGIApp:
+    def __call__(
+        self, environ: WSGIEnviron, start_response: StartResponse
+    ) -> Iterable[bytes]:
         """Process the request.
 
-        :param req: The request object
-        :returns: Response or calls the wrapped application
+        Identity headers are read from and written to the WSGI environ
+        directly, without wrapping the request in webob.
+
+        :param environ: WSGI environ dictionary
+        :param start_response: WSGI start_response callable
+        :returns: Response body
         """
         # Skip auth for root endpoint (version discovery)
-        if req.environ["PATH_INFO"] == "/":
-            return self.application
+        if environ["PATH_INFO"] == "/":
+            return self.application(environ, start_response)
 
         # Require a token for all other endpoints
-        if "X-Auth-Token" not in req.headers:
-            return webob.exc.HTTPUnauthorized()
+        token = environ.get("HTTP_X_AUTH_TOKEN")
+        if token is None:
+            return _unauthorized(environ, start_response)
 
-        token = req.headers["X-Auth-Token"]
         user_id, _sep, project_id = token.partition(":")
         project_id = project_id or user_id
 
         # Real keystone expands and flattens roles to include their implied
         # roles, e.g. admin implies member and reader, so tests should include
         # this flattened list also
-        if "HTTP_X_ROLES" in req.environ.keys():
-            roles = req.headers["X_ROLES"].split(",")
-        elif user_id == "admin":
-            roles = ["admin", "member", "reader"]
-        else:
-            roles = ["member", "reader"]
+        if "HTTP_X_ROLES" not in environ:
+            if user_id == "admin":
+                environ["HTTP_X_ROLES"] = _ADMIN_ROLES
+            else:
+                environ["HTTP_X_ROLES"] = _MEMBER_ROLES
 
-        req.headers["X_USER_ID"] = user_id
+        environ["HTTP_X_USER_ID"] = user_id
 
-        if not req.headers.get("OPENSTACK_SYSTEM_SCOPE"):
-            req.headers["X_TENANT_ID"] = project_id
+        if not environ.get("HTTP_OPENSTACK_SYSTEM_SCOPE"):
+            environ["HTTP_X_TENANT_ID"] = project_id
 
-        req.headers["X_ROLES"] = ",".join(roles)
-        return self.application
+        return self.application(environ, start_response)
 
 
 class TachyonKeystoneContext(Middleware):
     """Middleware that creates RequestContext from Keystone headers."""
 
-    @webob.dec.wsgify
-    def __call__(self, req: webob.Request) -> webob.Response | WSGIApp:
+    def __call__(
+        self, environ: WSGIEnviron, start_response: StartResponse
+    ) -> Iterable[bytes]:
         """Create RequestContext from Keystone headers.
 
-        :param req: The request object
-        :returns: Response or calls the wrapped application
+        The context is built from the environ directly, so no webob request
+        is created unless the request has to be rejected.
+
+        :param environ: WSGI environ dictionary
+        :param start_response: WSGI start_response callable
+        :returns: Response body
         """
-        req_id = req.environ.get(request_id.ENV_REQUEST_ID)
+        req_id = environ.get(request_id.ENV_REQUEST_ID)
 
-        ctx = context.RequestContext.from_environ(req.environ, request_id=req_id)
+        ctx = context.RequestContext.from_environ(environ, request_id=req_id)
 
         # Require user_id for all endpoints except root
-        if ctx.user_id is None and req.environ["PATH_INFO"] not in ["/", ""]:
+        if ctx.user_id is None and environ["PATH_INFO"] not in _ROOT_PATHS:
             LOG.debug("Neither X_USER_ID nor X_USER found in request")
-            return webob.exc.HTTPUnauthorized()
+            return _unauthorized(environ, start_response)
 
-        req.environ["tachyon.context"] = ctx
-        return self.application
+        environ["tachyon.context"] = ctx
+        return self.application(environ, start_response)
 
 
 class TachyonAuthProtocol(auth_token.AuthProtocol):
@@ -138,7 +165,7 @@ class TachyonAuthProtocol(auth_token.AuthProtocol):
 
     def __call__(
         self, environ: WSGIEnviron, start_response: StartResponse
-    ) -> list[bytes]:
+    ) -> Iterable[bytes]:
         """Process the request.
 
         Skip authentication for root endpoint.
@@ -147,7 +174,7 @@ class TachyonAuthProtocol(auth_token.AuthProtocol):
         :param start_response: WSGI start_response callable
         :returns: Response body
         """
-        if environ["PATH_INFO"] in ["/", ""]:
+        if environ["PATH_INFO"] in _ROOT_PATHS:
             return self._tachyon_app(environ, start_response)
 
         return super().__call__(environ, start_response)
@@ -17,7 +17,6 @@ from oslo_config import cfg
 from oslo_log import log as logging
 
 from tachyon import conf  # noqa: F401 - registers config options
-from tachyon.api import app
 
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
@@ -38,15 +37,26 @@ def main() -> int:
 
     logging.setup(CONF, "tachyon")
 
+    # Import the Flask stack only once options are parsed, so --help and
+    # config errors do not pay for loading it
+    from tachyon.api import app
+
     LOG.info("Starting Tachyon API development server")
 
     # Build Flask config from oslo.config
     flask_config = {
         "AUTH_STRATEGY": CONF.api.auth_strategy,
         "MAX_LIMIT": CONF.api.max_limit,
+        "TRAITS_CACHE_TTL": CONF.api.traits_cache_ttl,
         "NEO4J_URI": CONF.neo4j.uri,
         "NEO4J_USERNAME": CONF.neo4j.username,
         "NEO4J_PASSWORD": CONF.neo4j.password,
+        "NEO4J_DATABASE": CONF.neo4j.database,
+        "NEO4J_MAX_CONNECTION_POOL_SIZE": CONF.neo4j.max_connection_pool_size,
+        "NEO4J_CONNECTION_ACQUISITION_TIMEOUT": (
+            CONF.neo4j.connection_acquisition_timeout
+        ),
+        "NEO4J_MAX_CONNECTION_LIFETIME": CONF.neo4j.max_connection_lifetime,
     }
 
     flask_app = app.create_app(config=flask_config)
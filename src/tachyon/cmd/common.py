@@ -8,6 +8,7 @@ Based on nova/cmd/common.py patterns for oslo.config subcommand handling.
 from __future__ import annotations
 
 import argparse
+import functools
 import inspect
 from typing import Any
 from typing import Callable
@@ -16,6 +17,9 @@ from oslo_config import cfg
 
 CONF = cfg.CONF
 
+# Prefix of the CONF.category attributes holding action keyword arguments
+_ACTION_KWARG_PREFIX = "action_kwarg_"
+
 
 class MissingArgs(Exception):
     """Exception for missing required arguments."""
@@ -26,6 +30,21 @@ class MissingArgs(Exception):
         super().__init__(msg)
 
 
+@functools.cache
+def _required_args(fn: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the names of a function's arguments that have no default.
+
+    Signatures never change, so each function is only inspected once.
+
+    :param fn: the plain (unbound) function to inspect
+    :returns: tuple of required argument names, including 'self'
+    """
+    argspec = inspect.getfullargspec(fn)
+
+    num_defaults = len(argspec.defaults or [])
+    return tuple(argspec.args[: len(argspec.args) - num_defaults])
+
+
 def validate_args(
     fn: Callable[..., Any], *args: Any, **kwargs: Any
 ) -> list[str]:
@@ -36,17 +55,18 @@ def validate_args(
     :param kwargs: the keyword arguments supplied
     :returns: list of missing argument names
     """
-    argspec = inspect.getfullargspec(fn)
-
-    num_defaults = len(argspec.defaults or [])
-    required_args = argspec.args[: len(argspec.args) - num_defaults]
+    required_args = _required_args(getattr(fn, "__func__", fn))
 
     # Remove 'self' for bound methods
     if hasattr(fn, "__self__") and fn.__self__ is not None:
         required_args = required_args[1:]
 
+    if len(args) >= len(required_args):
+        return []
+
+    # Positional args fill the required args not given by keyword
     missing = [arg for arg in required_args if arg not in kwargs]
-    missing = missing[len(args) :]
+    del missing[: len(args)]
     return missing
 
 
@@ -88,11 +108,25 @@ def methods_of(obj: object) -> list[tuple[str, Callable[..., Any]]]:
     :param obj: object to inspect
     :returns: list of tuples of (method_name, method)
     """
-    result = []
-    for name in dir(obj):
-        if callable(getattr(obj, name)) and not name.startswith("_"):
-            result.append((name, getattr(obj, name)))
-    return result
+    cls: type = type(obj)
+    return [(name, getattr(obj, name)) for name in _method_names(cls)]
+
+
+@functools.cache
+def _method_names(cls: type) -> tuple[str, ...]:
+    """Get the names of a class's public callable attributes.
+
+    Command classes do not change once defined, so each is only scanned
+    once. Actions inherited from base classes or mixins are included.
+
+    :param cls: class to inspect
+    :returns: tuple of method names in alphabetical order
+    """
+    return tuple(
+        name
+        for name in dir(cls)
+        if not name.startswith("_") and callable(getattr(cls, name))
+    )
 
 
 def add_command_parsers(
@@ -130,19 +164,18 @@ def add_command_parsers(
 
             action_kwargs: list[str] = []
             for fn_args, fn_kwargs in getattr(action_fn, "args", []):
+                first = fn_args[0]
                 # Handle positional vs optional arguments
-                if fn_args[0] != fn_args[0].lstrip("-"):
-                    fn_kwargs.setdefault("dest", fn_args[0].lstrip("-"))
-                    if fn_kwargs["dest"].startswith("action_kwarg_"):
-                        action_kwargs.append(
-                            fn_kwargs["dest"][len("action_kwarg_") :]
-                        )
+                if first.startswith("-"):
+                    dest = fn_kwargs.setdefault("dest", first.lstrip("-"))
+                    if dest.startswith(_ACTION_KWARG_PREFIX):
+                        action_kwargs.append(dest[len(_ACTION_KWARG_PREFIX) :])
                     else:
-                        action_kwargs.append(fn_kwargs["dest"])
-                        fn_kwargs["dest"] = "action_kwarg_" + fn_kwargs["dest"]
+                        action_kwargs.append(dest)
+                        fn_kwargs["dest"] = _ACTION_KWARG_PREFIX + dest
                 else:
-                    action_kwargs.append(fn_args[0])
-                    fn_args = tuple("action_kwarg_" + arg for arg in fn_args)
+                    action_kwargs.append(first)
+                    fn_args = tuple(_ACTION_KWARG_PREFIX + arg for arg in fn_args)
 
                 action_parser.add_argument(*fn_args, **fn_kwargs)
 
@@ -159,13 +192,12 @@ def print_bash_completion(categories: dict[str, type]) -> None:
 
     :param categories: dict mapping category names to command classes
     """
-    if not CONF.category.query_category:
-        print(" ".join(categories.keys()))
-    elif CONF.category.query_category in categories:
-        fn = categories[CONF.category.query_category]
-        command_object = fn()
-        actions = methods_of(command_object)
-        print(" ".join([k for (k, v) in actions]))
+    query_category = CONF.category.query_category
+    if not query_category:
+        print(" ".join(categories))
+    elif query_category in categories:
+        # Actions are class attributes; don't instantiate the command class
+        print(" ".join(_method_names(categories[query_category])))
 
 
 def get_action_fn() -> tuple[
@@ -176,16 +208,17 @@ def get_action_fn() -> tuple[
     :returns: tuple of (function, positional_args, keyword_args)
     :raises MissingArgs: if required arguments are missing
     """
-    fn = CONF.category.action_fn
+    category = CONF.category
+    fn = category.action_fn
     fn_args: list[Any] = []
-    for arg in CONF.category.action_args:
+    for arg in category.action_args:
         if isinstance(arg, bytes):
             arg = arg.decode("utf-8")
         fn_args.append(arg)
 
     fn_kwargs: dict[str, Any] = {}
-    for k in CONF.category.action_kwargs:
-        v = getattr(CONF.category, "action_kwarg_" + k)
+    for k in category.action_kwargs:
+        v = getattr(category, _ACTION_KWARG_PREFIX + k)
         if v is None:
             continue
         if isinstance(v, bytes):
@@ -19,8 +19,6 @@ from oslo_log import log as logging
 
 from tachyon import conf  # noqa: F401 - registers config options
 from tachyon.cmd import common as cmd_common
-from tachyon.db import neo4j_api
-from tachyon.db import schema
 
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
@@ -31,6 +29,9 @@ _EXTRA_DEFAULT_LOG_LEVELS = [
     "neo4j=WARNING",
 ]
 
+# Commands that only print to stdout and never need logging configured
+_NO_LOGGING_COMMANDS = frozenset(("version", "bash-completion"))
+
 
 class DbCommands:
     """Class for managing the Neo4j database."""
@@ -43,11 +44,16 @@ class DbCommands:
         Applies all schema constraints and indexes to the Neo4j database.
         This command is idempotent - safe to run multiple times.
         """
+        # Deferred so other commands and --help skip loading the driver
+        from tachyon.db import neo4j_api
+        from tachyon.db import schema
+
         print("Connecting to Neo4j...")
         driver = neo4j_api.init_driver(
             CONF.neo4j.uri,
             CONF.neo4j.username,
             CONF.neo4j.password,
+            CONF.neo4j.database,
         )
         try:
             print("Applying database schema...")
@@ -67,6 +73,8 @@ class DbCommands:
         Displays the number and types of schema statements that will be
         applied when running 'db sync'.
         """
+        from tachyon.db import schema
+
         print(f"Schema statements: {len(schema.SCHEMA_STATEMENTS)}")
         print(f"  Uniqueness constraints: {len(schema.UNIQUENESS_CONSTRAINTS)}")
         print(f"  Existence constraints: {len(schema.EXISTENCE_CONSTRAINTS)}")
@@ -96,20 +104,28 @@ def main() -> int:
     )
     CONF.register_cli_opts([category_opt])
 
+    # Skip logging setup for commands that only print. Global options
+    # (including the logging ones) may only precede the command, so any
+    # other argv takes the full path and still accepts them.
+    argv = sys.argv[1:]
+    use_logging = not argv or argv[0] not in _NO_LOGGING_COMMANDS
+
     # Register logging options and parse config
-    logging.register_options(CONF)
+    if use_logging:
+        logging.register_options(CONF)
     try:
-        CONF(sys.argv[1:], project="tachyon")
+        CONF(argv, project="tachyon")
     except cfg.ConfigFilesNotFoundError:
         # Config file is optional for CLI commands
-        CONF(sys.argv[1:], project="tachyon", default_config_files=[])
+        CONF(argv, project="tachyon", default_config_files=[])
 
-    # Setup logging with reduced verbosity for CLI
-    logging.set_defaults(
-        default_log_levels=logging.get_default_log_levels()
-        + _EXTRA_DEFAULT_LOG_LEVELS
-    )
-    logging.setup(CONF, "tachyon")
+    if use_logging:
+        # Setup logging with reduced verbosity for CLI
+        logging.set_defaults(
+            default_log_levels=logging.get_default_log_levels()
+            + _EXTRA_DEFAULT_LOG_LEVELS
+        )
+        logging.setup(CONF, "tachyon")
 
     # Handle special commands
     if CONF.category.name == "version":
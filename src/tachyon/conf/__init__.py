@@ -29,6 +29,15 @@ api_opts: list[cfg.Opt] = [
         min=1,
         help="Maximum number of items returned in a single response.",
     ),
+    cfg.IntOpt(
+        "traits_cache_ttl",
+        default=0,
+        min=0,
+        help="Seconds to cache trait listings and lookups in each API "
+        "process. Writes handled by a process clear its cache, but other "
+        "processes may serve stale traits until the entries expire. "
+        "0 disables the cache.",
+    ),
 ]
 
 neo4j_opts: list[cfg.Opt] = [
@@ -39,6 +48,34 @@ neo4j_opts: list[cfg.Opt] = [
     cfg.StrOpt(
         "password", default="password", secret=True, help="Neo4j database password."
     ),
+    cfg.StrOpt(
+        "database",
+        default="neo4j",
+        help="Neo4j database name. Sessions name it explicitly so the driver "
+        "does not have to resolve the default database per session.",
+    ),
+    cfg.IntOpt(
+        "max_connection_pool_size",
+        default=100,
+        min=1,
+        help="Maximum number of connections each API process keeps open to "
+        "Neo4j. Requests wait for a free connection once this many are in "
+        "use, so size it to at least the number of request threads.",
+    ),
+    cfg.FloatOpt(
+        "connection_acquisition_timeout",
+        default=60.0,
+        min=0,
+        help="Seconds a request waits for a free pooled connection before failing.",
+    ),
+    cfg.FloatOpt(
+        "max_connection_lifetime",
+        default=3600.0,
+        min=0,
+        help="Seconds after which pooled connections are closed and "
+        "replaced. Keep this below any idle timeout enforced by load "
+        "balancers or firewalls between the API and Neo4j.",
+    ),
 ]
 
 
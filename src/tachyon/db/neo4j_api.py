@@ -4,16 +4,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Generator
 import contextlib
+import functools
+import threading
+from typing import TYPE_CHECKING
 from typing import Any
-
-import neo4j
+from typing import TypeVar
 
 from oslo_log import log
 
+if TYPE_CHECKING:
+    import neo4j
+
 LOG = log.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class Neo4jClient:
     """Lightweight Neo4j driver wrapper.
@@ -22,42 +30,117 @@ class Neo4jClient:
     """
 
     def __init__(
-        self, uri: str, username: str | None = None, password: str | None = None
+        self,
+        uri: str,
+        username: str | None = None,
+        password: str | None = None,
+        database: str | None = None,
+        **driver_config: Any,
     ) -> None:
         """Initialize the Neo4j client.
 
         :param uri: Neo4j database URI (bolt://...)
         :param username: Optional database username
         :param password: Optional database password
+        :param database: Optional database name. Naming the database saves
+            the driver a default-database lookup on every new session.
+        :param driver_config: Optional driver settings such as
+            ``max_connection_pool_size``. None values keep the driver default.
         """
-        LOG.debug("Connecting to Neo4j at %s", uri)
-        auth: tuple[str, str] | None = None
+        self._uri = uri
+        self._auth: tuple[str, str] | None = None
         if username and password:
-            auth = (username, password)
-        self._driver: neo4j.Driver = neo4j.GraphDatabase.driver(uri, auth=auth)
-        LOG.info("Neo4j driver created for %s", uri)
+            self._auth = (username, password)
+        self._driver_config = {k: v for k, v in driver_config.items() if v is not None}
+        self._database = database
+        self._driver_lock = threading.Lock()
+
+    @functools.cached_property
+    def _driver(self) -> neo4j.Driver:
+        """Create the Neo4j driver and its connection pool on first use.
+
+        :returns: Neo4j driver
+        """
+        # The driver is only loaded once a session is needed, keeping it out
+        # of imports and clients that never talk to the database
+        import neo4j
+
+        # cached_property does not lock, so concurrent first requests must
+        # not each build (and leak) a connection pool. The driver is cached
+        # before the lock is released, so a waiting thread always finds it.
+        with self._driver_lock:
+            driver: neo4j.Driver | None = self.__dict__.get("_driver")
+            if driver is None:
+                LOG.debug("Connecting to Neo4j at %s", self._uri)
+                driver = neo4j.GraphDatabase.driver(
+                    self._uri, auth=self._auth, **self._driver_config
+                )
+                self.__dict__["_driver"] = driver
+                LOG.info("Neo4j driver created for %s", self._uri)
+            return driver
 
     @contextlib.contextmanager
-    def session(self) -> Generator[Any, None, None]:
+    def session(self, **kwargs: Any) -> Generator[Any, None, None]:
         """Create a database session context manager.
 
+        :param kwargs: Extra session configuration, such as
+            ``default_access_mode``
         :yields: Neo4j session
         """
-        with self._driver.session() as session:
+        with self._driver.session(database=self._database, **kwargs) as session:
             yield session
 
+    def execute_read(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a transaction function in a managed read transaction.
+
+        The driver retries the function on transient errors, so it must be
+        safe to run more than once.
+
+        :param fn: Transaction function called as ``fn(tx, *args, **kwargs)``
+        :param args: Positional arguments for fn
+        :param kwargs: Keyword arguments for fn
+        :returns: The value returned by fn
+        """
+        with self._driver.session(database=self._database) as session:
+            return session.execute_read(fn, *args, **kwargs)
+
+    def execute_write(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a transaction function in a managed write transaction.
+
+        The driver retries the function on transient errors, so it must be
+        safe to run more than once.
+
+        :param fn: Transaction function called as ``fn(tx, *args, **kwargs)``
+        :param args: Positional arguments for fn
+        :param kwargs: Keyword arguments for fn
+        :returns: The value returned by fn
+        """
+        with self._driver.session(database=self._database) as session:
+            return session.execute_write(fn, *args, **kwargs)
+
     def close(self) -> None:
         """Close the database driver."""
+        # Don't create a driver just to close it
+        if "_driver" not in self.__dict__:
+            return
         LOG.debug("Closing Neo4j driver")
         self._driver.close()
 
 
-def init_driver(uri: str, username: str | None, password: str | None) -> Neo4jClient:
+def init_driver(
+    uri: str,
+    username: str | None,
+    password: str | None,
+    database: str | None = None,
+    **driver_config: Any,
+) -> Neo4jClient:
     """Initialize a Neo4j client.
 
     :param uri: Neo4j database URI
     :param username: Database username
     :param password: Database password
+    :param database: Database name sessions are opened against
+    :param driver_config: Optional driver settings, see Neo4jClient
     :returns: Neo4jClient instance
     """
-    return Neo4jClient(uri, username, password)
+    return Neo4jClient(uri, username, password, database, **driver_config)
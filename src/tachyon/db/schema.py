@@ -21,7 +21,7 @@ import os_traits
 LOG = log.getLogger(__name__)
 
 # Uniqueness constraints (also create indexes automatically)
-UNIQUENESS_CONSTRAINTS: list[str] = [
+UNIQUENESS_CONSTRAINTS: tuple[str, ...] = (
     # Resource Provider
     "CREATE CONSTRAINT rp_uuid_unique IF NOT EXISTS "
     "FOR (rp:ResourceProvider) REQUIRE rp.uuid IS UNIQUE",
@@ -45,22 +45,22 @@ UNIQUENESS_CONSTRAINTS: list[str] = [
     # User
     "CREATE CONSTRAINT user_external_id_unique IF NOT EXISTS "
     "FOR (u:User) REQUIRE u.external_id IS UNIQUE",
-]
+)
 
 # Property existence constraints
 # NOTE: These require Neo4j Enterprise Edition and are skipped in Community Edition.
 # The application logic enforces these constraints instead.
-EXISTENCE_CONSTRAINTS: list[str] = [
+EXISTENCE_CONSTRAINTS: tuple[str, ...] = (
     # Resource Provider must have generation
     # "CREATE CONSTRAINT rp_generation_exists IF NOT EXISTS "
     # "FOR (rp:ResourceProvider) REQUIRE rp.generation IS NOT NULL",
     # Consumer must have generation
     # "CREATE CONSTRAINT consumer_generation_exists IF NOT EXISTS "
     # "FOR (c:Consumer) REQUIRE c.generation IS NOT NULL",
-]
+)
 
 # Performance indexes (beyond those created by uniqueness constraints)
-INDEXES: list[str] = [
+INDEXES: tuple[str, ...] = (
     # Trait name index (for fast lookups)
     "CREATE INDEX trait_name_idx IF NOT EXISTS FOR (t:Trait) ON (t.name)",
     # Resource Class name index
@@ -69,10 +69,12 @@ INDEXES: list[str] = [
     "CREATE INDEX consumer_uuid_idx IF NOT EXISTS FOR (c:Consumer) ON (c.uuid)",
     # Aggregate UUID index
     "CREATE INDEX agg_uuid_idx IF NOT EXISTS FOR (agg:Aggregate) ON (agg.uuid)",
-]
+)
 
 # All schema statements in order
-SCHEMA_STATEMENTS: list[str] = UNIQUENESS_CONSTRAINTS + EXISTENCE_CONSTRAINTS + INDEXES
+SCHEMA_STATEMENTS: tuple[str, ...] = (
+    UNIQUENESS_CONSTRAINTS + EXISTENCE_CONSTRAINTS + INDEXES
+)
 
 
 def _register_standard_resource_classes(session: Any) -> None:
@@ -81,14 +83,14 @@ def _register_standard_resource_classes(session: Any) -> None:
     :param session: Neo4j session to execute statements against
     """
     LOG.debug("Registering %d standard resource classes", len(orc.STANDARDS))
-    for rc_name in orc.STANDARDS:
-        session.run(
-            """
-            MERGE (rc:ResourceClass {name: $name})
-            ON CREATE SET rc.created_at = datetime(), rc.updated_at = datetime()
-            """,
-            name=rc_name,
-        )
+    session.run(
+        """
+        UNWIND $names AS name
+        MERGE (rc:ResourceClass {name: name})
+        ON CREATE SET rc.created_at = datetime(), rc.updated_at = datetime()
+        """,
+        names=list(orc.STANDARDS),
+    ).consume()
     LOG.info("Registered %d standard resource classes", len(orc.STANDARDS))
 
 
@@ -100,14 +102,14 @@ def _register_standard_traits(session: Any) -> None:
     # os_traits.TRAITS is a frozenset of all standard trait names
     traits = list(os_traits.TRAITS)
     LOG.debug("Registering %d standard traits", len(traits))
-    for trait_name in traits:
-        session.run(
-            """
-            MERGE (t:Trait {name: $name})
-            ON CREATE SET t.created_at = datetime(), t.updated_at = datetime()
-            """,
-            name=trait_name,
-        )
+    session.run(
+        """
+        UNWIND $names AS name
+        MERGE (t:Trait {name: name})
+        ON CREATE SET t.created_at = datetime(), t.updated_at = datetime()
+        """,
+        names=traits,
+    ).consume()
     LOG.info("Registered %d standard traits", len(traits))
 
 
@@ -124,9 +126,13 @@ def apply_schema(session: Any, max_retries: int = 3) -> None:
     for attempt in range(max_retries):
         try:
             LOG.debug("Applying %d schema statements", len(SCHEMA_STATEMENTS))
-            for statement in SCHEMA_STATEMENTS:
-                LOG.debug("Executing schema statement: %s", statement[:60])
-                session.run(statement)
+            # One transaction for all schema statements; data writes cannot
+            # share it, so standard names are registered separately below
+            with session.begin_transaction() as tx:
+                for statement in SCHEMA_STATEMENTS:
+                    LOG.debug("Executing schema statement: %s", statement[:60])
+                    tx.run(statement)
+                tx.commit()
             LOG.info("Schema applied successfully")
 
             # Register standard resource classes and traits
@@ -22,21 +22,27 @@ from tachyon.policies import resource_provider
 from tachyon.policies import trait
 from tachyon.policies import usage
 
-
-def list_rules() -> list[policy.RuleDefault]:
-    """Return a list of all policy rules.
-
-    :returns: List of RuleDefault instances
+# Policy modules in registration order
+_MODULES = (
+    base,
+    resource_provider,
+    resource_class,
+    inventory,
+    aggregate,
+    usage,
+    trait,
+    allocation,
+    allocation_candidate,
+)
+
+_ALL_RULES: tuple[policy.RuleDefault, ...] = tuple(
+    itertools.chain.from_iterable(module.list_rules() for module in _MODULES)
+)
+
+
+def list_rules() -> tuple[policy.RuleDefault, ...]:
+    """Return all policy rules.
+
+    :returns: Tuple of RuleDefault instances
     """
-    rules = itertools.chain(
-        base.list_rules(),
-        resource_provider.list_rules(),
-        resource_class.list_rules(),
-        inventory.list_rules(),
-        aggregate.list_rules(),
-        usage.list_rules(),
-        trait.list_rules(),
-        allocation.list_rules(),
-        allocation_candidate.list_rules(),
-    )
-    return list(rules)
+    return _ALL_RULES
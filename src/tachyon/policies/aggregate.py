@@ -12,7 +12,7 @@ PREFIX = "placement:resource_providers:aggregates:%s"
 LIST = PREFIX % "list"
 UPDATE = PREFIX % "update"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -37,12 +37,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return aggregate policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
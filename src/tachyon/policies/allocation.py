@@ -14,7 +14,7 @@ MANAGE = PREFIX % "manage"
 UPDATE = PREFIX % "update"
 DELETE = PREFIX % "delete"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -63,12 +63,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return allocation policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
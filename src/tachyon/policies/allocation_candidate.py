@@ -10,7 +10,7 @@ from tachyon.policies import base
 
 LIST = "placement:allocation_candidates:list"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -23,12 +23,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return allocation candidate policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
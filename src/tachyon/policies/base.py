@@ -18,7 +18,7 @@ ADMIN_OR_PROJECT_READER_OR_SERVICE = (
     "role:admin or role:reader and project_id:%(project_id)s or role:service"
 )
 
-rules = [
+rules = (
     policy.RuleDefault(
         name="admin_api",
         check_str=ADMIN,
@@ -49,12 +49,12 @@ rules = [
         description="Default rule for project level reader APIs.",
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.RuleDefault]:
+def list_rules() -> tuple[policy.RuleDefault, ...]:
     """Return base policy rules.
 
-    :returns: List of RuleDefault instances
+    :returns: Tuple of RuleDefault instances
     """
     return rules
@@ -16,7 +16,7 @@ UPDATE = PREFIX % "update"
 DELETE = PREFIX % "delete"
 DELETE_ALL = PREFIX % "delete_all"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -93,12 +93,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return inventory policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
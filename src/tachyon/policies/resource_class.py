@@ -15,7 +15,7 @@ SHOW = PREFIX % "show"
 UPDATE = PREFIX % "update"
 DELETE = PREFIX % "delete"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -76,12 +76,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return resource class policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
@@ -19,7 +19,7 @@ RP_TRAIT_LIST = RP_TRAIT_PREFIX % "list"
 RP_TRAIT_UPDATE = RP_TRAIT_PREFIX % "update"
 RP_TRAIT_DELETE = RP_TRAIT_PREFIX % "delete"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=LIST,
         check_str=base.ADMIN_OR_SERVICE,
@@ -104,12 +104,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return trait policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
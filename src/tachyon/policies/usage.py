@@ -11,7 +11,7 @@ from tachyon.policies import base
 PROVIDER_USAGES = "placement:resource_providers:usages"
 TOTAL_USAGES = "placement:usages"
 
-rules = [
+rules = (
     policy.DocumentedRuleDefault(
         name=PROVIDER_USAGES,
         check_str=base.ADMIN_OR_SERVICE,
@@ -38,12 +38,12 @@ rules = [
         ],
         scope_types=["project"],
     ),
-]
+)
 
 
-def list_rules() -> list[policy.DocumentedRuleDefault]:
+def list_rules() -> tuple[policy.DocumentedRuleDefault, ...]:
     """Return usage policy rules.
 
-    :returns: List of DocumentedRuleDefault instances
+    :returns: Tuple of DocumentedRuleDefault instances
     """
     return rules
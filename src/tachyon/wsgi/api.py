@@ -55,9 +55,16 @@ def deploy(conf_obj: cfg.ConfigOpts) -> WSGIApp:
     flask_config = {
         "AUTH_STRATEGY": conf_obj.api.auth_strategy,
         "MAX_LIMIT": conf_obj.api.max_limit,
+        "TRAITS_CACHE_TTL": conf_obj.api.traits_cache_ttl,
         "NEO4J_URI": conf_obj.neo4j.uri,
         "NEO4J_USERNAME": conf_obj.neo4j.username,
         "NEO4J_PASSWORD": conf_obj.neo4j.password,
+        "NEO4J_DATABASE": conf_obj.neo4j.database,
+        "NEO4J_MAX_CONNECTION_POOL_SIZE": conf_obj.neo4j.max_connection_pool_size,
+        "NEO4J_CONNECTION_ACQUISITION_TIMEOUT": (
+            conf_obj.neo4j.connection_acquisition_timeout
+        ),
+        "NEO4J_MAX_CONNECTION_LIFETIME": conf_obj.neo4j.max_connection_lifetime,
     }
 
     LOG.debug(
@@ -52,6 +52,20 @@ class TestCreateApp(base.BaseTestCase):
         self.assertIn("allocations", blueprint_names)
         self.assertIn("usages", blueprint_names)
 
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_usage_routes_registered_once(self, mock_init_neo4j):
+        """Test each usage URL is served by a single usages view."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+        for path in ("/usages", "/resource_providers/<string:rp_uuid>/usages"):
+            endpoints = [
+                rule.endpoint
+                for rule in flask_app.url_map.iter_rules()
+                if rule.rule == path
+            ]
+            self.assertEqual(1, len(endpoints), path)
+            self.assertTrue(endpoints[0].startswith("usages."), path)
+
 
 class TestAPIErrors(base.BaseTestCase):
     """Tests for API error handling."""
@@ -107,9 +121,9 @@ class TestAPIErrors(base.BaseTestCase):
 
         with flask_app.app_context():
             error = errors.NotFound("Resource xyz not found")
-            response, status = error.to_response()
+            response = error.to_response()
 
-            self.assertEqual(status, 404)
+            self.assertEqual(response.status_code, 404)
             data = response.get_json()
             self.assertIn("errors", data)
             self.assertEqual(len(data["errors"]), 1)
@@ -123,11 +137,9 @@ class TestAPIErrors(base.BaseTestCase):
         flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
 
         with flask_app.app_context():
-            response, status = errors.error_response(
-                422, "Unprocessable", "Cannot process"
-            )
+            response = errors.error_response(422, "Unprocessable", "Cannot process")
 
-            self.assertEqual(status, 422)
+            self.assertEqual(response.status_code, 422)
             data = response.get_json()
             self.assertEqual(data["errors"][0]["status"], 422)
             self.assertEqual(data["errors"][0]["title"], "Unprocessable")
@@ -139,7 +151,7 @@ class TestSchemaHelpers(base.BaseTestCase):
 
     def test_uniqueness_constraints_defined(self):
         """Test that uniqueness constraints are properly defined."""
-        self.assertIsInstance(schema.UNIQUENESS_CONSTRAINTS, list)
+        self.assertIsInstance(schema.UNIQUENESS_CONSTRAINTS, tuple)
         self.assertGreater(len(schema.UNIQUENESS_CONSTRAINTS), 0)
 
         # Check that all statements are strings
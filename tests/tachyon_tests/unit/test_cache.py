@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the Tachyon API result cache."""
+
+from unittest import mock
+
+from oslo_utils import uuidutils
+from oslotest import base
+
+from tachyon import policy
+from tachyon.api import app
+from tachyon.api import cache
+
+
+class TestTTLCache(base.BaseTestCase):
+    """Tests for TTLCache."""
+
+    def test_get_missing(self):
+        """Test a missing key returns the MISSING sentinel."""
+        c = cache.TTLCache(maxsize=2, ttl=10)
+        self.assertIs(c.get("nope"), cache.MISSING)
+
+    def test_set_and_get(self):
+        """Test cached values are returned, including falsy ones."""
+        c = cache.TTLCache(maxsize=2, ttl=10)
+        c.set("a", False)
+        self.assertIs(c.get("a"), False)
+
+    @mock.patch("time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        """Test entries are dropped once the TTL has passed."""
+        mock_monotonic.return_value = 100.0
+        c = cache.TTLCache(maxsize=2, ttl=10)
+        c.set("a", 1)
+        mock_monotonic.return_value = 109.0
+        self.assertEqual(c.get("a"), 1)
+        mock_monotonic.return_value = 110.0
+        self.assertIs(c.get("a"), cache.MISSING)
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is evicted when full."""
+        c = cache.TTLCache(maxsize=2, ttl=10)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.get("a")
+        c.set("c", 3)
+        self.assertEqual(c.get("a"), 1)
+        self.assertIs(c.get("b"), cache.MISSING)
+        self.assertEqual(c.get("c"), 3)
+
+    def test_clear(self):
+        """Test clear drops all entries."""
+        c = cache.TTLCache(maxsize=2, ttl=10)
+        c.set("a", 1)
+        c.clear()
+        self.assertIs(c.get("a"), cache.MISSING)
+
+
+class TestTraitsCache(base.BaseTestCase):
+    """Tests for the per-application trait cache."""
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_disabled_by_default(self, mock_init_neo4j):
+        """Test no trait cache is created without a TTL."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+        with flask_app.app_context():
+            self.assertIsNone(cache.traits_cache())
+            # Clearing a disabled cache is a no-op
+            cache.clear_traits_cache()
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_enabled_with_ttl(self, mock_init_neo4j):
+        """Test a trait cache is created and cleared when enabled."""
+        flask_app = app.create_app(
+            {"TESTING": True, "SKIP_DB_INIT": True, "TRAITS_CACHE_TTL": 30}
+        )
+        with flask_app.app_context():
+            traits_cache = cache.traits_cache()
+            self.assertIsInstance(traits_cache, cache.TTLCache)
+            self.assertEqual(traits_cache.ttl, 30)
+            traits_cache.set("a", 1)
+            cache.clear_traits_cache()
+            self.assertIs(traits_cache.get("a"), cache.MISSING)
+
+
+class TestTraitsCacheInvalidation(base.BaseTestCase):
+    """Tests that trait-affecting writes invalidate cached listings."""
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def setUp(self, mock_init_neo4j):
+        """Set up test fixtures."""
+        super().setUp()
+        self.app = app.create_app(
+            {"TESTING": True, "SKIP_DB_INIT": True, "TRAITS_CACHE_TTL": 30}
+        )
+        self.driver = mock.MagicMock()
+        self.driver.execute_read.return_value = ["CUSTOM_A"]
+        self.app.extensions["neo4j_driver"] = self.driver
+        self.client = self.app.test_client()
+        self.headers = {"X-Auth-Token": "admin"}
+        patcher = mock.patch.object(
+            policy, "authorize", autospec=True, return_value=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _list_associated(self):
+        response = self.client.get("/traits?associated=true", headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"traits": ["CUSTOM_A"]})
+
+    def test_listing_cached(self):
+        """Test a repeated listing is served from the cache."""
+        self._list_associated()
+        self._list_associated()
+        self.driver.execute_read.assert_called_once()
+
+    def test_delete_resource_provider_invalidates(self):
+        """Test deleting a provider drops cached associated listings."""
+        self._list_associated()
+
+        session = self.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.side_effect = [
+            {"rp": {}},
+            {"cnt": 0},
+            {"cnt": 0},
+        ]
+        response = self.client.delete(
+            "/resource_providers/%s" % uuidutils.generate_uuid(),
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 204)
+
+        self._list_associated()
+        self.assertEqual(self.driver.execute_read.call_count, 2)
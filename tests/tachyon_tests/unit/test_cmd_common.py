@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the Tachyon CLI helpers."""
+
+from oslotest import base
+
+from tachyon.cmd import common
+
+
+class _MixinCommands:
+    def inherited(self):
+        pass
+
+
+class _Commands(_MixinCommands):
+    description = "Test commands"
+
+    def sync(self):
+        pass
+
+    def apply(self):
+        pass
+
+    def _private(self):
+        pass
+
+
+class TestMethodsOf(base.BaseTestCase):
+    """Tests for methods_of."""
+
+    def test_methods_sorted(self):
+        """Test public actions are listed alphabetically."""
+        names = [name for name, _fn in common.methods_of(_Commands())]
+        self.assertEqual(names, ["apply", "inherited", "sync"])
+
+    def test_methods_bound(self):
+        """Test the returned callables are bound to the object."""
+        obj = _Commands()
+        methods = dict(common.methods_of(obj))
+        self.assertIs(methods["sync"].__self__, obj)
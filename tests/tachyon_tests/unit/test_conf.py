@@ -45,6 +45,10 @@ class TestConfigOptions(base.BaseTestCase):
         self.test_conf.set_override("max_limit", 500, group="api")
         self.assertEqual(self.test_conf.api.max_limit, 500)
 
+    def test_traits_cache_ttl_default(self):
+        """Test traits_cache_ttl defaults to disabled."""
+        self.assertEqual(self.test_conf.api.traits_cache_ttl, 0)
+
     def test_auto_apply_schema_default(self):
         """Test auto_apply_schema default value."""
         self.assertTrue(self.test_conf.api.auto_apply_schema)
@@ -61,6 +65,16 @@ class TestConfigOptions(base.BaseTestCase):
         """Test Neo4j password default value."""
         self.assertEqual(self.test_conf.neo4j.password, "password")
 
+    def test_neo4j_database_default(self):
+        """Test Neo4j database default value."""
+        self.assertEqual(self.test_conf.neo4j.database, "neo4j")
+
+    def test_neo4j_pool_defaults(self):
+        """Test Neo4j connection pool defaults match the driver's."""
+        self.assertEqual(self.test_conf.neo4j.max_connection_pool_size, 100)
+        self.assertEqual(self.test_conf.neo4j.connection_acquisition_timeout, 60.0)
+        self.assertEqual(self.test_conf.neo4j.max_connection_lifetime, 3600.0)
+
 
 class TestListOpts(base.BaseTestCase):
     """Tests for list_opts function."""
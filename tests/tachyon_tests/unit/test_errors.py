@@ -4,10 +4,14 @@
 
 from unittest import mock
 
+import flask
+
 from oslotest import base
 
+from tachyon import policy
 from tachyon.api import app
 from tachyon.api import errors
+from tachyon.api import microversion
 
 
 class TestTachyonException(base.BaseTestCase):
@@ -155,6 +159,28 @@ class TestDuplicateUUID(base.BaseTestCase):
         self.assertIn("already exists", exc.detail)
 
 
+class TestPolicyErrorHandler(base.BaseTestCase):
+    """Tests for converting policy failures into responses."""
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_matches_api_error(self, mock_init_neo4j):
+        """Test the cached body matches PolicyNotAuthorized.to_response."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+        action = "placement:traits:list"
+
+        with flask_app.test_request_context():
+            response = errors._handle_policy_error(policy.PolicyNotAuthorized(action))
+            expected = errors.PolicyNotAuthorized(action=action).to_response()
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.get_data(), expected.get_data())
+
+    def test_body_cached_per_action(self):
+        """Test each action's body is only encoded once."""
+        body = errors._policy_error_body("placement:cached")
+        self.assertIs(errors._policy_error_body("placement:cached"), body)
+
+
 class TestExceptionToResponse(base.BaseTestCase):
     """Tests for exception to_response method."""
 
@@ -165,9 +191,9 @@ class TestExceptionToResponse(base.BaseTestCase):
 
         with flask_app.app_context():
             exc = errors.NotFound("Resource xyz not found")
-            response, status = exc.to_response()
+            response = exc.to_response()
 
-            self.assertEqual(status, 404)
+            self.assertEqual(response.status_code, 404)
             data = response.get_json()
             self.assertIn("errors", data)
             self.assertEqual(len(data["errors"]), 1)
@@ -182,12 +208,85 @@ class TestExceptionToResponse(base.BaseTestCase):
 
         with flask_app.app_context():
             exc = errors.ResourceProviderGenerationConflict()
-            response, status = exc.to_response()
+            response = exc.to_response()
 
             data = response.get_json()
             self.assertIn("code", data["errors"][0])
             self.assertEqual(data["errors"][0]["code"], "placement.concurrent_update")
 
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_to_response_matches_jsonify(self, mock_init_neo4j):
+        """Test the pre-encoded body matches jsonify output."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+        with flask_app.test_request_context():
+            flask.g.microversion = microversion.Microversion(1, 23)
+            exc = errors.ResourceProviderGenerationConflict(reason='a "quoted" é')
+            response = exc.to_response()
+            expected = flask.jsonify(
+                {
+                    "errors": [
+                        {
+                            "status": 409,
+                            "title": "Conflict",
+                            "detail": exc.detail,
+                            "code": "placement.concurrent_update",
+                        }
+                    ]
+                }
+            )
+
+            self.assertEqual(response.status_code, 409)
+            self.assertEqual(response.mimetype, "application/json")
+            self.assertEqual(response.get_data(), expected.get_data())
+
+    @mock.patch.object(errors, "_should_include_error_code", autospec=True)
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_to_response_reuses_class_skeleton(
+        self, mock_init_neo4j, mock_include_code
+    ):
+        """Test code-less errors reuse the cached body and skip the mv check."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+        errors._error_body_parts.cache_clear()
+
+        with flask_app.app_context():
+            errors.NotFound("first").to_response()
+            response = errors.NotFound("second").to_response()
+
+        info = errors._error_body_parts.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+        mock_include_code.assert_not_called()
+        self.assertEqual(
+            response.get_data(),
+            b'{"errors":[{"detail":"second","status":404,"title":"Not Found"}]}\n',
+        )
+
+
+class TestShouldIncludeErrorCode(base.BaseTestCase):
+    """Tests for the microversion gate on error codes."""
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def setUp(self, mock_init_neo4j):
+        """Set up test fixtures."""
+        super().setUp()
+        self.app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+    def test_no_microversion(self):
+        """Test codes are omitted, and nothing cached, without a microversion."""
+        with self.app.test_request_context():
+            self.assertFalse(errors._should_include_error_code())
+            self.assertNotIn("_include_error_code", flask.g)
+
+    def test_result_cached_per_request(self):
+        """Test the microversion is only checked once per request."""
+        with self.app.test_request_context():
+            mv = mock.Mock(spec=microversion.Microversion)
+            mv.is_at_least.return_value = True
+            flask.g.microversion = mv
+            self.assertTrue(errors._should_include_error_code())
+            self.assertTrue(errors._should_include_error_code())
+            mv.is_at_least.assert_called_once_with(23)
+
 
 class TestErrorResponseHelper(base.BaseTestCase):
     """Tests for error_response helper function."""
@@ -198,16 +297,37 @@ class TestErrorResponseHelper(base.BaseTestCase):
         flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
 
         with flask_app.app_context():
-            response, status = errors.error_response(
+            response = errors.error_response(
                 422, "Unprocessable", "Cannot process request"
             )
 
-            self.assertEqual(status, 422)
+            self.assertEqual(response.status_code, 422)
             data = response.get_json()
             self.assertEqual(data["errors"][0]["status"], 422)
             self.assertEqual(data["errors"][0]["title"], "Unprocessable")
             self.assertEqual(data["errors"][0]["detail"], "Cannot process request")
 
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_generic_errors_prebuilt(self, mock_init_neo4j):
+        """Test generic error bodies match error_response output."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+        with flask_app.app_context():
+            for status, (title, detail) in errors._GENERIC_ERRORS.items():
+                response = errors._generic_error(status)
+                expected = errors.error_response(status, title, detail)
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(response.get_data(), expected.get_data())
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def test_not_found_handler(self, mock_init_neo4j):
+        """Test unknown routes get the pre-built 404 body."""
+        flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+        resp = flask_app.test_client().get("/no-such-route")
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(resp.get_data(), errors._GENERIC_BODIES[404])
+
 
 class TestBackwardCompatibility(base.BaseTestCase):
     """Tests for backward compatibility with old API."""
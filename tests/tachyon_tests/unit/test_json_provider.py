@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the Tachyon orjson JSON provider."""
+
+import dataclasses
+import datetime
+import decimal
+from unittest import mock
+import uuid
+
+import flask
+
+from oslotest import base
+
+from tachyon.api import app
+from tachyon.api import json_provider
+
+
+class TestOrjsonProvider(base.BaseTestCase):
+    """Tests for OrjsonProvider."""
+
+    @mock.patch.object(app, "_init_neo4j", autospec=True)
+    def setUp(self, mock_init_neo4j):
+        """Set up test fixtures."""
+        super().setUp()
+        self.app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+
+    def test_app_uses_orjson_provider(self):
+        """Test create_app installs the orjson provider."""
+        self.assertIsInstance(self.app.json, json_provider.OrjsonProvider)
+
+    def test_jsonify_compact_sorted_with_newline(self):
+        """Test jsonify output matches Flask's default formatting."""
+        with self.app.app_context():
+            resp = flask.jsonify({"traits": ["B", "A"], "a": 1})
+        self.assertEqual(resp.get_data(), b'{"a":1,"traits":["B","A"]}\n')
+        self.assertEqual(resp.mimetype, "application/json")
+
+    def test_dumps_returns_str(self):
+        """Test dumps returns a sorted JSON string."""
+        self.assertEqual(self.app.json.dumps({"b": 1, "a": 2}), '{"a":2,"b":1}')
+
+    def test_loads_bytes(self):
+        """Test loads accepts bytes."""
+        self.assertEqual(self.app.json.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_date_falls_back_to_http_date(self):
+        """Test dates use Flask's default HTTP-date serialization."""
+        value = datetime.date(2024, 1, 2)
+        self.assertEqual(self.app.json.dumps(value), '"Tue, 02 Jan 2024 00:00:00 GMT"')
+
+    def test_non_str_keys_converted(self):
+        """Test non-string dict keys are converted as json.dumps does."""
+        self.assertEqual(self.app.json.dumps({1: "a", "b": 2}), '{"1":"a","b":2}')
+
+    def test_fallback_types(self):
+        """Test decimals, UUIDs, dataclasses and markup are serialized."""
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Markup:
+            def __html__(self):
+                return "<b>x</b>"
+
+        value = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        self.assertEqual(
+            self.app.json.dumps([decimal.Decimal("1.5"), value, Point(1), Markup()]),
+            '["1.5","12345678-1234-5678-1234-567812345678",{"x":1},"<b>x</b>"]',
+        )
+
+    def test_unserializable_raises(self):
+        """Test unknown types raise TypeError."""
+        self.assertRaises(TypeError, self.app.json.dumps, object())
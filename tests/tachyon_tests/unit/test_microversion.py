@@ -37,6 +37,11 @@ class TestMicroversion(base.BaseTestCase):
         self.assertTrue(mv2 > mv1)
         self.assertEqual(mv1, mv3)
 
+    def test_microversion_uses_slots(self):
+        """Test Microversion instances carry no per-instance dict."""
+        mv = microversion.Microversion(1, 10)
+        self.assertFalse(hasattr(mv, "__dict__"))
+
     def test_microversion_immutable(self):
         """Test that Microversion is immutable (frozen)."""
         mv = microversion.Microversion(1, 10)
@@ -84,6 +89,46 @@ class TestMicroversionParse(base.BaseTestCase):
         mv = microversion.parse("compute 2.1")
         self.assertEqual(mv, microversion.Microversion(1, 0))
 
+    def test_parse_with_validation_memoized(self):
+        """Test repeated headers reuse the parsed Microversion."""
+        mv = microversion.parse_with_validation("placement 1.17")
+        self.assertIs(mv, microversion.parse_with_validation("placement 1.17"))
+
+    def test_parse_multiple_services(self):
+        """Test the placement version is found among other services."""
+        mv = microversion.parse("compute 2.1, placement 1.7")
+        self.assertEqual(mv, microversion.Microversion(1, 7))
+
+    def test_parse_returns_shared_instances(self):
+        """Test distinct headers for one version share an instance."""
+        self.assertIs(
+            microversion.parse("placement 1.17"),
+            microversion.parse("placement  1.17"),
+        )
+        self.assertIs(microversion.parse(None), microversion.parse("compute 2.1"))
+        self.assertIs(
+            microversion.parse("placement latest"),
+            microversion.parse("placement LATEST"),
+        )
+
+    def test_parse_with_validation_malformed(self):
+        """Test malformed version strings raise MicroversionParseError."""
+        for version in ("1.2.3", "pony.horse", "1.", ".5", "1"):
+            self.assertRaises(
+                microversion.MicroversionParseError,
+                microversion.parse_with_validation,
+                "placement %s" % version,
+            )
+
+    def test_parse_with_validation_errors_not_cached(self):
+        """Test rejected headers raise on every call."""
+        for _ in range(2):
+            self.assertRaises(
+                microversion.MicroversionNotAcceptable,
+                microversion.parse_with_validation,
+                "placement 1.999",
+            )
+
 
 class TestMicroversionConstants(base.BaseTestCase):
     """Tests for microversion constants."""
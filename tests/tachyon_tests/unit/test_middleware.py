@@ -4,10 +4,14 @@
 
 from unittest import mock
 
+import flask
+
 from oslotest import base
 
 from tachyon.api import app
+from tachyon.api import errors
 from tachyon.api import microversion
+from tachyon.api import middleware
 
 
 class TestMiddleware(base.BaseTestCase):
@@ -52,16 +56,84 @@ class TestMiddleware(base.BaseTestCase):
         expected = "placement 1.%d" % microversion.MAX_SUPPORTED_MINOR
         self.assertIn(expected, response.headers["OpenStack-API-Version"])
 
+    @mock.patch.object(microversion, "parse_with_validation", autospec=True)
+    def test_no_header_skips_parsing(self, mock_parse):
+        """Test requests without a version header use 1.0 without parsing."""
+        with self.app.test_request_context("/"):
+            self.assertIsNone(self.app.preprocess_request())
+            self.assertEqual(flask.g.microversion, microversion.Microversion(1, 0))
+            self.assertEqual(flask.g.microversion_header, "placement 1.0")
+        mock_parse.assert_not_called()
+
     def test_vary_header_present(self):
         """Test Vary header is set for microversion negotiation."""
         response = self.client.get("/", headers={"X-Auth-Token": "admin"})
         self.assertEqual(response.headers.get("Vary"), "OpenStack-API-Version")
 
+    def test_single_request_hooks(self):
+        """Test the request checks are registered as one hook each way."""
+        self.assertEqual(
+            self.app.before_request_funcs[None], [middleware._preprocess_request]
+        )
+        self.assertEqual(
+            self.app.after_request_funcs[None], [middleware._add_microversion_headers]
+        )
+
+    def test_root_skips_context(self):
+        """Test version discovery only negotiates the microversion."""
+        headers = {"OpenStack-API-Version": "placement 1.15"}
+        with self.app.test_request_context("/", headers=headers):
+            self.assertIsNone(self.app.preprocess_request())
+            self.assertEqual(flask.g.microversion, microversion.Microversion(1, 15))
+            self.assertNotIn("context", flask.g)
+
     def test_accept_header_missing_ok_root(self):
         """Test request with no Accept header succeeds on root."""
         response = self.client.get("/", headers={"X-Auth-Token": "admin"})
         self.assertNotEqual(response.status_code, 406)
 
+    def test_accept_html_rejected_on_route(self):
+        """Test a known route rejects clients that do not accept JSON."""
+        response = self.client.get(
+            "/traits", headers={"X-Auth-Token": "admin", "Accept": "text/html"}
+        )
+        self.assertEqual(response.status_code, 406)
+
+    def test_accept_html_unknown_route_404(self):
+        """Test an unknown route 404s rather than failing the Accept check."""
+        response = self.client.get(
+            "/no-such-route", headers={"X-Auth-Token": "admin", "Accept": "text/html"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class TestParseRoles(base.BaseTestCase):
+    """Tests for the X-Roles header parser."""
+
+    def test_parse_roles(self):
+        """Test roles are stripped and empty entries dropped."""
+        self.assertEqual(
+            middleware._parse_roles(" admin, ,member,reader "),
+            ("admin", "member", "reader"),
+        )
+
+    def test_parse_roles_empty(self):
+        """Test an empty header yields no roles."""
+        self.assertEqual(middleware._parse_roles(""), ())
+
+    def test_context_roles_not_shared(self):
+        """Test each request context gets its own roles list."""
+        with mock.patch.object(app, "_init_neo4j", autospec=True):
+            flask_app = app.create_app({"TESTING": True, "SKIP_DB_INIT": True})
+        headers = {"X-User-Id": "u", "X-Roles": "reader"}
+        contexts = []
+        for _ in range(2):
+            with flask_app.test_request_context("/traits", headers=headers):
+                flask_app.preprocess_request()
+                contexts.append(flask.g.context)
+        self.assertEqual(contexts[0].roles, ["reader"])
+        self.assertIsNot(contexts[0].roles, contexts[1].roles)
+
 
 class TestContentTypeValidation(base.BaseTestCase):
     """Tests for Content-Type validation middleware."""
@@ -85,6 +157,26 @@ class TestContentTypeValidation(base.BaseTestCase):
         )
         self.assertEqual(response.status_code, 415)
 
+    def test_body_without_content_type(self):
+        """Test a body without Content-Type returns 400."""
+        with self.app.test_request_context(
+            "/resource_providers",
+            method="POST",
+            data=b"{}",
+            headers={"X-Auth-Token": "admin"},
+        ):
+            flask.request.environ.pop("CONTENT_TYPE", None)
+            self.assertRaises(errors.BadRequest, self.app.preprocess_request)
+
+    def test_empty_body_no_content_type_required(self):
+        """Test bodyless PUT/POST requests skip the Content-Type check."""
+        with self.app.test_request_context(
+            "/resource_providers",
+            method="POST",
+            headers={"X-Auth-Token": "admin", "Content-Length": "0"},
+        ):
+            self.assertIsNone(self.app.preprocess_request())
+
     def test_get_no_content_type_required(self):
         """Test GET requests don't require Content-Type."""
         # Mock session for resource_providers endpoint
@@ -150,3 +242,29 @@ class TestAcceptsJsonHelper(base.BaseTestCase):
             from tachyon.api import middleware
 
             self.assertFalse(middleware._accepts_json())
+
+    def test_accepts_json_in_list_with_params(self):
+        """Test JSON listed among other types with parameters is accepted."""
+        headers = {"Accept": "text/html, Application/JSON;q=0.9"}
+        with self.app.test_request_context("/", headers=headers):
+            from tachyon.api import middleware
+
+            self.assertTrue(middleware._accepts_json())
+
+    def test_parsed_accept_memoized(self):
+        """Test multi-range Accept headers are only parsed once."""
+        middleware._media_ranges_allow_json.cache_clear()
+        headers = {"Accept": "text/html, application/json"}
+        for _ in range(2):
+            with self.app.test_request_context("/", headers=headers):
+                self.assertTrue(middleware._accepts_json())
+        info = middleware._media_ranges_allow_json.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_rejects_json_suffix_type(self):
+        """Test a media type merely starting with application/json is rejected."""
+        headers = {"Accept": "application/json-patch+json"}
+        with self.app.test_request_context("/", headers=headers):
+            from tachyon.api import middleware
+
+            self.assertFalse(middleware._accepts_json())
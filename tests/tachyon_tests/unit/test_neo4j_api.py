@@ -2,8 +2,12 @@
 
 """Unit tests for the Tachyon Neo4j API module."""
 
+import threading
+import time
 from unittest import mock
 
+import neo4j
+
 from oslotest import base
 
 from tachyon.db import neo4j_api
@@ -19,18 +23,32 @@ class TestNeo4jClient(base.BaseTestCase):
             uri="bolt://localhost:7687", username="neo4j", password="password"
         )
 
+        self.assertIs(client._driver, mock_driver.return_value)
         mock_driver.assert_called_once_with(
             "bolt://localhost:7687", auth=("neo4j", "password")
         )
-        self.assertIsNotNone(client)
 
     @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
     def test_client_creation_without_auth(self, mock_driver):
         """Test Neo4jClient creation without authentication."""
         client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687")
 
+        self.assertIs(client._driver, mock_driver.return_value)
         mock_driver.assert_called_once_with("bolt://localhost:7687", auth=None)
-        self.assertIsNotNone(client)
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_client_creation_with_pool_config(self, mock_driver):
+        """Test pool settings are passed to the driver, skipping None."""
+        client = neo4j_api.Neo4jClient(
+            uri="bolt://localhost:7687",
+            max_connection_pool_size=200,
+            connection_acquisition_timeout=None,
+        )
+
+        self.assertIs(client._driver, mock_driver.return_value)
+        mock_driver.assert_called_once_with(
+            "bolt://localhost:7687", auth=None, max_connection_pool_size=200
+        )
 
     @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
     def test_session_context_manager(self, mock_driver):
@@ -50,6 +68,53 @@ class TestNeo4jClient(base.BaseTestCase):
         with client.session() as session:
             self.assertIsNotNone(session)
 
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_session_uses_configured_database(self, mock_driver):
+        """Test sessions are opened against the configured database."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687", database="tachyon")
+
+        with client.session():
+            pass
+
+        mock_driver.return_value.session.assert_called_once_with(database="tachyon")
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_session_passes_extra_config(self, mock_driver):
+        """Test extra session configuration is passed to the driver."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687")
+
+        with client.session(default_access_mode=neo4j.READ_ACCESS):
+            pass
+
+        mock_driver.return_value.session.assert_called_once_with(
+            database=None, default_access_mode=neo4j.READ_ACCESS
+        )
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_execute_read(self, mock_driver):
+        """Test execute_read runs the function in a managed transaction."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687", database="db")
+        session = mock_driver.return_value.session.return_value.__enter__.return_value
+        fn = mock.Mock()
+
+        result = client.execute_read(fn, "a", b=1)
+
+        mock_driver.return_value.session.assert_called_once_with(database="db")
+        session.execute_read.assert_called_once_with(fn, "a", b=1)
+        self.assertIs(result, session.execute_read.return_value)
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_execute_write(self, mock_driver):
+        """Test execute_write runs the function in a managed transaction."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687", database="db")
+        session = mock_driver.return_value.session.return_value.__enter__.return_value
+        fn = mock.Mock()
+
+        result = client.execute_write(fn, "a", b=1)
+
+        session.execute_write.assert_called_once_with(fn, "a", b=1)
+        self.assertIs(result, session.execute_write.return_value)
+
     @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
     def test_close_driver(self, mock_driver):
         """Test Neo4jClient close method."""
@@ -57,9 +122,56 @@ class TestNeo4jClient(base.BaseTestCase):
             uri="bolt://localhost:7687", username="neo4j", password="password"
         )
 
+        with client.session():
+            pass
         client.close()
         mock_driver.return_value.close.assert_called_once()
 
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_driver_created_on_first_use(self, mock_driver):
+        """Test the driver is only created when first needed, and once."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687")
+        mock_driver.assert_not_called()
+
+        for _ in range(2):
+            with client.session():
+                pass
+        mock_driver.assert_called_once_with("bolt://localhost:7687", auth=None)
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_driver_created_once_concurrently(self, mock_driver):
+        """Test threads racing on first use share a single driver."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687")
+        barrier = threading.Barrier(8)
+        drivers = []
+
+        def _slow_driver(*args, **kwargs):
+            time.sleep(0.01)
+            return mock.Mock()
+
+        def _use():
+            barrier.wait()
+            # Call the getter directly: cached_property itself only locks
+            # on Python < 3.12
+            drivers.append(neo4j_api.Neo4jClient._driver.func(client))
+
+        mock_driver.side_effect = _slow_driver
+        threads = [threading.Thread(target=_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_driver.assert_called_once()
+        self.assertEqual(len({id(driver) for driver in drivers}), 1)
+
+    @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
+    def test_close_unused_client(self, mock_driver):
+        """Test closing an unused client does not create a driver."""
+        client = neo4j_api.Neo4jClient(uri="bolt://localhost:7687")
+        client.close()
+        mock_driver.assert_not_called()
+
 
 class TestInitDriver(base.BaseTestCase):
     """Tests for init_driver function."""
@@ -76,10 +188,11 @@ class TestInitDriver(base.BaseTestCase):
     @mock.patch("neo4j.GraphDatabase.driver", autospec=True)
     def test_init_driver_passes_credentials(self, mock_driver):
         """Test init_driver passes credentials to driver."""
-        neo4j_api.init_driver(
+        client = neo4j_api.init_driver(
             uri="bolt://localhost:7687", username="testuser", password="testpass"
         )
 
+        self.assertIs(client._driver, mock_driver.return_value)
         mock_driver.assert_called_with(
             "bolt://localhost:7687", auth=("testuser", "testpass")
         )
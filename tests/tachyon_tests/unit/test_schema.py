@@ -54,25 +54,58 @@ class TestSchemaConstants(base.BaseTestCase):
         )
         self.assertTrue(has_consumer_constraint)
 
+    def test_project_external_id_constraint(self):
+        """Test Project external_id uniqueness constraint exists."""
+        has_project_constraint = any(
+            "Project" in c and "external_id" in c for c in schema.UNIQUENESS_CONSTRAINTS
+        )
+        self.assertTrue(has_project_constraint)
+
+    def test_trait_name_constraint(self):
+        """Test Trait name uniqueness constraint exists."""
+        has_trait_constraint = any(
+            "Trait" in c and "name" in c for c in schema.UNIQUENESS_CONSTRAINTS
+        )
+        self.assertTrue(has_trait_constraint)
+
 
 class TestApplySchema(base.BaseTestCase):
     """Tests for apply_schema function."""
 
     def test_apply_schema_runs_all_statements(self):
-        """Test apply_schema runs all schema statements."""
+        """Test apply_schema runs all schema statements in one transaction."""
         mock_session = mock.MagicMock()
+        mock_tx = mock_session.begin_transaction.return_value.__enter__.return_value
 
         schema.apply_schema(mock_session)
 
-        self.assertEqual(mock_session.run.call_count, len(schema.SCHEMA_STATEMENTS))
+        mock_session.begin_transaction.assert_called_once_with()
+        self.assertEqual(mock_tx.run.call_count, len(schema.SCHEMA_STATEMENTS))
+        mock_tx.commit.assert_called_once_with()
 
     def test_apply_schema_calls_with_statements(self):
         """Test apply_schema passes correct statements."""
         mock_session = mock.MagicMock()
+        mock_tx = mock_session.begin_transaction.return_value.__enter__.return_value
 
         schema.apply_schema(mock_session)
 
-        calls = mock_session.run.call_args_list
+        calls = mock_tx.run.call_args_list
         for i, call in enumerate(calls):
             args, kwargs = call
             self.assertEqual(args[0], schema.SCHEMA_STATEMENTS[i])
+
+    @mock.patch.object(schema, "_register_standard_traits", autospec=True)
+    def test_apply_schema_registers_classes_in_one_statement(self, mock_traits):
+        """Test standard resource classes are registered with one UNWIND."""
+        mock_session = mock.MagicMock()
+
+        schema.apply_schema(mock_session)
+
+        mock_session.run.assert_called_once()
+        query = mock_session.run.call_args.args[0]
+        self.assertIn("UNWIND $names", query)
+        self.assertEqual(
+            mock_session.run.call_args.kwargs["names"], list(schema.orc.STANDARDS)
+        )
+        mock_traits.assert_called_once_with(mock_session)